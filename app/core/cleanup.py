@@ -3,6 +3,7 @@ import shutil
 
 from app.core.config import DATA_DIR, OUTPUT_DIR
 from app.core.logger import log
+from app.core.strikeout import clear_strikeout_cache
 
 
 # ------------------------------------------------
@@ -40,6 +41,9 @@ def cleanup_all_folders():
     if os.path.exists(summary_dir):
         total += cleanup_folder(summary_dir, "SUMMARY")
 
+    # Marked sheets cached in memory carry the same PII as the files above
+    clear_strikeout_cache()
+
     log(f"✅ RESET COMPLETE: {total} total files deleted")
     log("🗑 CLEARING ALL LOGS...")
     log("=" * 50)
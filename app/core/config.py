@@ -68,23 +68,48 @@ REVIEW_JSON_PATH = os.path.join(OUTPUT_DIR, "SEA_PAY_REVIEW.json")
 FONT_NAME = "TimesNewRoman"
 FONT_SIZE = 11
 
+# -----------------------------------
+# SIGNATURE ENCODING
+# -----------------------------------
+
+# Varied signature PNGs are re-compressed wherever they are embedded, so
+# encode them with the cheapest deflate level instead of zlib's default.
+SIGNATURE_FAST_ENCODE = True
+
+# Resolution of embedded PG-13 signatures, as a multiple of the drawn size
+# in points (4 = 288 dpi). Pad captures are far larger than the 30-35pt
+# tall boxes they land in, so anything above print resolution is wasted.
+SIGNATURE_OVERSAMPLE = 4
+
 # -----------------------------------
 # CERTIFYING OFFICER HELPER FUNCTIONS
 # -----------------------------------
 
+# Parsed certifying_officer.json, reused while the file's mtime/size are unchanged.
+# Every PG-13 and TORIS form asks for the officer name/date; without this each
+# request re-opened and re-parsed the JSON.
+_CERTIFYING_OFFICER_CACHE = {"stamp": None, "data": {}}
+
+
 def load_certifying_officer():
     """
     Load certifying officer information from JSON file.
     Returns dict with keys: rate, last_name, first_name, middle_name
     Returns empty dict if file doesn't exist or can't be read.
     """
-    if not os.path.exists(CERTIFYING_OFFICER_FILE):
+    try:
+        st = os.stat(CERTIFYING_OFFICER_FILE)
+    except OSError:
         return {}
 
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _CERTIFYING_OFFICER_CACHE["stamp"] == stamp:
+        return dict(_CERTIFYING_OFFICER_CACHE["data"])
+
     try:
         with open(CERTIFYING_OFFICER_FILE, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            return {
+            officer = {
                 'rate': data.get('rate', '').strip(),
                 'last_name': data.get('last_name', '').strip(),
                 'first_name': data.get('first_name', '').strip(),
@@ -95,6 +120,10 @@ def load_certifying_officer():
         print(f"Warning: Could not load certifying officer info: {e}")
         return {}
 
+    _CERTIFYING_OFFICER_CACHE["stamp"] = stamp
+    _CERTIFYING_OFFICER_CACHE["data"] = officer
+    return dict(officer)
+
 
 def save_certifying_officer(rate, last_name, first_name, middle_name, date_yyyymmdd=""):
     """
@@ -111,6 +140,7 @@ def save_certifying_officer(rate, last_name, first_name, middle_name, date_yyyym
     try:
         with open(CERTIFYING_OFFICER_FILE, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
+        _CERTIFYING_OFFICER_CACHE["stamp"] = None
         return True
     except Exception as e:
         print(f"Error: Could not save certifying officer info: {e}")
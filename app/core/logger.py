@@ -1,3 +1,4 @@
+import os
 import threading
 from datetime import datetime
 
@@ -17,6 +18,9 @@ _PROGRESS = {
 
 _MAX_LOG_LINES = 2000
 
+# Per-row trace lines (log_debug) are only built and kept with SEAPAY_DEBUG_LOG=1
+DEBUG_LOGGING = os.environ.get("SEAPAY_DEBUG_LOG", "") == "1"
+
 
 def _ts() -> str:
     return datetime.now().strftime("%H:%M:%S")
@@ -36,6 +40,15 @@ def log(message: str) -> None:
             del _LOGS[: len(_LOGS) - _MAX_LOG_LINES]
 
 
+def log_debug(message_fn) -> None:
+    """
+    Trace-level log(): message_fn is a zero-arg callable returning the line,
+    only called (and formatted) when DEBUG_LOGGING is on.
+    """
+    if DEBUG_LOGGING:
+        log(message_fn())
+
+
 def clear_logs() -> None:
     with _LOCK:
         _LOGS.clear()
@@ -1,18 +1,10 @@
 import os
 import io
+import atexit
+import threading
 from datetime import datetime
-
-from PyPDF2 import PdfReader, PdfWriter
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.colors import black
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-
-# Register Times New Roman TTF
-pdfmetrics.registerFont(
-    TTFont("TimesNewRoman", "/app/Times_New_Roman.ttf")
-)
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from app.core.logger import log
 from app.core.config import (
@@ -20,26 +12,560 @@ from app.core.config import (
     FONT_NAME,
     FONT_SIZE,
     SEA_PAY_PG13_FOLDER,
+    SIGNATURES_FILE,
+    SIGNATURE_OVERSAMPLE,
     get_certifying_officer_name,
     get_certifying_officer_name_pg13,
     get_certifying_date_yyyymmdd,
     get_signature_for_member_location
 )
 from app.core.rates import resolve_identity
-from reportlab.lib.utils import ImageReader
+
+# pypdf / reportlab are imported inside the functions that use them so that
+# importing this module (e.g. in a worker process, or just for flatten_pdf)
+# does not pay for the reportlab import or the TTF parse up front.
+__all__ = [
+    "flatten_pdf",
+    "make_consolidated_all_missions_pdf",
+    "make_consolidated_pdf_for_ship",
+    "make_pdf_for_ship",
+]
+
+
+# ------------------------------------------------
+# FONT REGISTRATION (ON FIRST RENDER)
+# ------------------------------------------------
+@lru_cache(maxsize=1)
+def _register_font():
+    """
+    Register Times New Roman TTF the first time a PG-13 is rendered.
+    Skips the TTF parse if the font is already registered in this process
+    (e.g. by the TORIS certifier, which registers it under the same name).
+    """
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    if "TimesNewRoman" not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(
+            TTFont("TimesNewRoman", "/app/Times_New_Roman.ttf")
+        )
+
+
+# ------------------------------------------------
+# TEXT WIDTH CACHE
+# ------------------------------------------------
+@lru_cache(maxsize=256)
+def _sw(text, font, size):
+    """
+    Memoized pdfmetrics.stringWidth. The underline and date strings measured
+    for every PG-13 are the same handful of values across a batch.
+    """
+    from reportlab.pdfbase import pdfmetrics
+
+    return pdfmetrics.stringWidth(text, font, size)
+
+
+# ------------------------------------------------
+# TEMPLATE CACHE
+# ------------------------------------------------
+# The parsed template reader is shared by every render; pypdf readers are
+# not safe to resolve objects from concurrently, so cloning from it (and the
+# one-time font map built from it) happens under this lock.
+_TEMPLATE_LOCK = threading.Lock()
+
+# The template can be replaced from the UI (routes: template_pdf upload), so
+# every cache below is keyed on the template file's mtime/size and rebuilt
+# on the first render after an upload.
+def _template_stamp():
+    try:
+        st = os.stat(TEMPLATE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1)
+def _template_bytes(stamp):
+    """Raw bytes of the NAVPERS 1070/613 template, read once per version."""
+    with open(TEMPLATE, "rb") as f:
+        return f.read()
+
+
+def _draw_static_fields(c):
+    """Text that is identical on every PG-13 this tool produces."""
+    c.setFont(FONT_NAME, FONT_SIZE)
+    c.drawString(39, 689, "AFLOAT TRAINING GROUP SAN DIEGO (UIC. 49365)")
+    c.drawString(373, 671, "X")
+    c.setFont(FONT_NAME, 8)
+    c.drawString(39, 650, "ENTITLEMENT")
+    c.drawString(345, 641, "OPNAVINST 7220.14")
+
+    c.setFont(FONT_NAME, 10)
+    c.drawString(38.8, 83, "SEA PAY CERTIFIER")
+    c.drawString(503.5, 40, "USN AD")
+
+
+# Certifying-official block geometry (shared by the static and per-member parts)
+_SIG_LEFT_X = 356.26
+_SIG_LINE_TEXT = "____________________________________"
+_SIG_LINE_FONT_SIZE = 8
+
+
+def _draw_signature_lines(c, sig_y, bottom_line_y):
+    """Underlines and captions of the certifying-official block."""
+    sig_line_w = _sw(_SIG_LINE_TEXT, FONT_NAME, _SIG_LINE_FONT_SIZE)
+    sig_mid_x = _SIG_LEFT_X + (sig_line_w / 2.0)
+
+    c.setFont(FONT_NAME, _SIG_LINE_FONT_SIZE)
+    c.drawString(_SIG_LEFT_X, sig_y, _SIG_LINE_TEXT)
+    c.drawString(_SIG_LEFT_X, bottom_line_y, _SIG_LINE_TEXT)
+
+    c.setFont(FONT_NAME, 10)
+    c.drawCentredString(sig_mid_x, sig_y - 12, "Certifying Official & Date")
+    c.drawCentredString(sig_mid_x, bottom_line_y - 12.3, "FI MI Last Name")
+
+
+@lru_cache(maxsize=8)
+def _stamped_template_bytes(stamp, sig_layout=None):
+    """
+    Template with the static header/footer fields already merged in, so
+    each render only draws and merges the member-specific content.
+    sig_layout=(sig_y, bottom_line_y) also bakes in the certifying-official
+    underlines/captions at that position; only a handful of positions are
+    ever used (fixed per-ship layout, all-missions layout by line count).
+    """
+    from pypdf import PdfReader, PdfWriter
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+
+    buf = io.BytesIO()
+    _register_font()
+    c = canvas.Canvas(buf, pagesize=letter, pageCompression=1)
+    _draw_static_fields(c)
+    if sig_layout is not None:
+        _draw_signature_lines(c, *sig_layout)
+    c.save()
+    buf.seek(0)
+
+    writer = PdfWriter()
+    base = writer.add_page(PdfReader(io.BytesIO(_template_bytes(stamp))).pages[0])
+    base.merge_page(PdfReader(buf).pages[0].clone(writer))
+    # One content stream, so a render can rewrite it in place
+    _flatten_page(base, writer)
+
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
 
 
+@lru_cache(maxsize=8)
+def _template_reader(stamp, sig_layout=None):
+    """
+    Parsed (pre-stamped) template, shared by every render. PdfWriter.add_page
+    clones the page into the writer, so merging an overlay never touches
+    this copy.
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(_stamped_template_bytes(stamp, sig_layout)))
+    # Resolve every object now so later clones are pure cache hits
+    for page in reader.pages:
+        page.get_contents()
+    return reader
+
+
+def _font_file_data(font):
+    """Decoded embedded TrueType program of a font resource, or None."""
+    try:
+        descriptor = font.get_object()["/FontDescriptor"].get_object()
+        return descriptor["/FontFile2"].get_object().get_data()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _template_fonts(stamp, sig_layout=None):
+    """Embedded fonts of the stamped template, keyed by their font file bytes."""
+    fonts = _template_reader(stamp, sig_layout).pages[0]["/Resources"]["/Font"].get_object()
+    shared = {}
+    for ref in fonts.values():
+        data = _font_file_data(ref)
+        if data is not None:
+            shared[data] = ref
+    return shared
+
+
+def _share_template_fonts(page, stamp, sig_layout=None):
+    """
+    reportlab embeds the same Times New Roman subset in every overlay that
+    the stamped template already carries. Point the overlay at the
+    template's copy so each PDF embeds the font once.
+    """
+    from pypdf.generic import NameObject
+
+    fonts = page["/Resources"].get("/Font")
+    if fonts is None:
+        return
+
+    shared = _template_fonts(stamp, sig_layout)
+    fonts = fonts.get_object()
+    for name, ref in list(fonts.items()):
+        tpl_ref = shared.get(_font_file_data(ref))
+        if tpl_ref is not None:
+            fonts[NameObject(name)] = tpl_ref
+
+
+def _flatten_page(page, writer):
+    """
+    Flatten one page in place: drop form widgets, collapse the content
+    stream array into a single stream, and clear /Rotate.
+    """
+    if "/Annots" in page:
+        del page["/Annots"]
+
+    from pypdf.generic import DecodedStreamObject, IndirectObject, NameObject
+
+    contents = page.get("/Contents")
+    if isinstance(contents, IndirectObject) and isinstance(contents.get_object(), list):
+        contents = contents.get_object()
+    if isinstance(contents, list):
+        stream = DecodedStreamObject()
+        stream.set_data(b"".join(obj.get_object().get_data() for obj in contents))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    elif contents is not None and not isinstance(contents, IndirectObject):
+        # merge_page leaves the merged stream inline; streams must be indirect
+        page[NameObject("/Contents")] = writer._add_object(contents)
+
+    if "/Rotate" in page:
+        del page["/Rotate"]
+
+
+def _write_over_template(overlay_buf, outpath, sig_layout=None):
+    """
+    Stamp the reportlab overlay onto a clone of the template page, flatten
+    it and write the final PDF in a single pass (no flatten_pdf re-read).
+    sig_layout selects the stamped template carrying the signature block
+    lines (see _stamped_template_bytes).
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    stamp = _template_stamp()
+
+    overlay = PdfReader(overlay_buf)
+    overlay_page = overlay.pages[0]
+
+    writer = PdfWriter()
+    with _TEMPLATE_LOCK:
+        _share_template_fonts(overlay_page, stamp, sig_layout)
+        base = writer.add_page(_template_reader(stamp, sig_layout).pages[0])
+    # Overlay must live in the same writer or its fonts/images are dropped
+    base.merge_page(overlay_page.clone(writer))
+
+    # Fresh writer: the template's /AcroForm is never copied onto the root
+    _flatten_page(base, writer)
+
+    # pypdf emits many tiny writes; a 1 MB buffer covers a whole PG-13
+    with open(outpath, "wb", buffering=1 << 20) as f:
+        writer.write(f)
+
+
+# ------------------------------------------------
+# DIRECT OVERLAY STREAM (NO REPORTLAB CANVAS)
+# ------------------------------------------------
+# Every PG-13 overlay is a few dozen text operators and at most two
+# signature images. Rather than building a whole PDF with reportlab and
+# parsing it straight back, _StreamCanvas writes the operators itself and
+# _write_stream_over_template appends them to the template page.
+#
+# Text uses the Times New Roman subset the stamped template already embeds.
+# With rl_config.ttfAsciiReadable on (the default) reportlab puts every
+# ASCII glyph in a TTF font's first subset under its own code, so ASCII
+# text can be written into that font unchanged. With it off the subset is
+# filled in order of first use and the direct path is not taken.
+class _DirectFallback(Exception):
+    """The overlay needs something only the reportlab canvas can draw."""
+
+
+@lru_cache(maxsize=8)
+def _template_text_font(stamp, sig_layout=None):
+    """
+    Resource name of the stamped template's ASCII Times New Roman subset,
+    or None if the template does not carry it or its codes are not plain
+    ASCII (ttfAsciiReadable off, or /Widths disagreeing with the font).
+    """
+    from reportlab import rl_config
+    from reportlab.pdfbase import pdfmetrics
+
+    _register_font()
+    ttf = pdfmetrics.getFont(FONT_NAME)
+    if not getattr(ttf, "_asciiReadable", rl_config.ttfAsciiReadable):
+        return None
+    suffix = "+" + ttf.face.name.decode("latin-1")
+    expected = [ttf.face.getCharWidth(code) for code in range(32, 127)]
+
+    # The cached reader is shared with the render threads
+    with _TEMPLATE_LOCK:
+        fonts = _template_reader(stamp, sig_layout).pages[0]["/Resources"]["/Font"].get_object()
+        for name, ref in fonts.items():
+            font = ref.get_object()
+            if not (
+                str(font.get("/BaseFont", "")).endswith(suffix)
+                and font.get("/FirstChar") == 0
+                and font.get("/LastChar", 0) >= 126
+            ):
+                continue
+            widths = font.get("/Widths")
+            widths = list(widths.get_object()) if widths is not None else []
+            # reportlab writes widths rounded to four places (fp_str)
+            if len(widths) >= 127 and all(
+                abs(float(w) - e) < 0.01 for w, e in zip(widths[32:127], expected)
+            ):
+                return name
+    return None
+
+
+def _fp(v):
+    """Compact PDF number, like reportlab's fp_str."""
+    return f"{v:.4f}".rstrip("0").rstrip(".") or "0"
+
+
+def _pdf_text(text):
+    """Escape text for a literal string in the template's ASCII subset."""
+    if not all(" " <= ch <= "~" for ch in text):
+        raise _DirectFallback(f"non-ASCII text: {text!r}")
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+class _StreamText:
+    """reportlab textobject subset: origin, leading and textLine."""
+
+    def __init__(self, canvas, x=0, y=0):
+        self._ops = [
+            "BT",
+            f"1 0 0 1 {_fp(x)} {_fp(y)} Tm",
+            f"{canvas._font} {_fp(canvas._font_size)} Tf",
+            f"{_fp(canvas._leading)} TL",
+        ]
+
+    def setTextOrigin(self, x, y):
+        self._ops.append(f"1 0 0 1 {_fp(x)} {_fp(y)} Tm")
+
+    def setLeading(self, leading):
+        self._ops.append(f"{_fp(leading)} TL")
+
+    def textLine(self, text=""):
+        self._ops.append(f"({_pdf_text(text)}) Tj T*")
+
+
+class _StreamCanvas:
+    """
+    The slice of the reportlab canvas API the PG-13 renderers use, emitting
+    PDF operators directly. Any other canvas call raises _DirectFallback so
+    the form is rendered through reportlab instead.
+    """
+
+    def __init__(self, font_resource):
+        self._font = font_resource
+        self._font_size = 12
+        self._leading = 14.4
+        self._ops = []
+        self._images = []
+
+    def __getattr__(self, name):
+        raise _DirectFallback(f"canvas.{name}")
+
+    def setFont(self, psfontname, size, leading=None):
+        if psfontname != FONT_NAME:
+            raise _DirectFallback(f"font {psfontname}")
+        self._font_size = size
+        self._leading = size * 1.2 if leading is None else leading
+
+    def drawString(self, x, y, text):
+        self._ops.append(
+            f"BT 1 0 0 1 {_fp(x)} {_fp(y)} Tm "
+            f"{self._font} {_fp(self._font_size)} Tf ({_pdf_text(text)}) Tj ET"
+        )
+
+    def drawCentredString(self, x, y, text):
+        self.drawString(x - _sw(text, FONT_NAME, self._font_size) / 2.0, y, text)
+
+    def beginText(self, x=0, y=0):
+        return _StreamText(self, x, y)
+
+    def drawText(self, text):
+        self._ops.extend(text._ops)
+        self._ops.append("ET")
+
+    def draw_png(self, png_bytes, x, y, width, height):
+        name = f"/PG13Sig{len(self._images)}"
+        self._images.append((name, png_bytes))
+        self._ops.append(
+            f"q {_fp(width)} 0 0 {_fp(height)} {_fp(x)} {_fp(y)} cm {name} Do Q"
+        )
+
+    def content(self):
+        return "\n".join(self._ops).encode("latin-1")
+
+
+@lru_cache(maxsize=32)
+def _png_image_planes(png_bytes):
+    """(width, height, deflated RGB, deflated alpha) of a prepared signature PNG."""
+    import zlib
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png_bytes)) as im:
+        im = im.convert("RGBA")
+    return (
+        im.width,
+        im.height,
+        zlib.compress(im.convert("RGB").tobytes()),
+        zlib.compress(im.getchannel("A").tobytes()),
+    )
+
+
+def _image_xobject(writer, width, height, data, colorspace, smask=None):
+    from pypdf.generic import NameObject, NumberObject, StreamObject
+
+    # data is already Flate-compressed; a plain StreamObject writes it as is
+    stream = StreamObject()
+    stream.set_data(data)
+    stream.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(width),
+        NameObject("/Height"): NumberObject(height),
+        NameObject("/ColorSpace"): NameObject(colorspace),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+        NameObject("/Filter"): NameObject("/FlateDecode"),
+    })
+    if smask is not None:
+        stream[NameObject("/SMask")] = smask
+    return writer._add_object(stream)
+
+
+def _write_stream_over_template(sc, outpath, stamp, sig_layout=None):
+    """
+    Append a _StreamCanvas's operators (and its signature images) to a
+    clone of the stamped template page, flatten it and write it once.
+    """
+    from pypdf import PdfWriter
+    from pypdf.generic import DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    with _TEMPLATE_LOCK:
+        base = writer.add_page(_template_reader(stamp, sig_layout).pages[0])
+    # The stamped template has a single content stream (see
+    # _stamped_template_bytes); this writer owns its own copy of it.
+    contents = base["/Contents"].get_object()
+
+    if sc._images:
+        resources = base["/Resources"].get_object()
+        xobjects = resources.get("/XObject")
+        if xobjects is None:
+            xobjects = resources[NameObject("/XObject")] = DictionaryObject()
+        xobjects = xobjects.get_object()
+        for name, png_bytes in sc._images:
+            w, h, rgb, alpha = _png_image_planes(png_bytes)
+            smask = _image_xobject(writer, w, h, alpha, "/DeviceGray")
+            xobjects[NameObject(name)] = _image_xobject(writer, w, h, rgb, "/DeviceRGB", smask)
+
+    # Template and overlay each start from the default graphics state
+    contents.set_data(
+        b"q\n" + contents.get_data() + b"\nQ\nq\n" + sc.content() + b"\nQ\n"
+    )
+
+    _flatten_page(base, writer)
+
+    with open(outpath, "wb", buffering=1 << 20) as f:
+        writer.write(f)
+
+
+# ------------------------------------------------
+# SIGNATURE PNG CACHE
+# ------------------------------------------------
+def _trim_signature(sig_image_pil):
+    """Trim transparent padding so signatures look like real ink on the line."""
+    try:
+        if sig_image_pil.mode in ("RGBA", "LA") or ("transparency" in sig_image_pil.info):
+            alpha = sig_image_pil.split()[-1]
+            bbox = alpha.getbbox()
+            if bbox:
+                sig_image_pil = sig_image_pil.crop(bbox)
+    except Exception:
+        pass
+    return sig_image_pil
+
+
+def _signatures_stamp():
+    """
+    mtime of signatures.json. Passed into _prepared_signature as part of the
+    cache key so a (re)assignment made in the UI is picked up on the next PDF.
+    """
+    try:
+        return os.stat(SIGNATURES_FILE).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _fit_signature(sig_image_pil, max_width, max_height):
+    """Trim, then return (image, final_w, final_h) fitted to the box in points."""
+    sig_image_pil = _trim_signature(sig_image_pil)
+
+    orig_w, orig_h = sig_image_pil.size
+    scale = min(max_width / orig_w, max_height / orig_h)
+    return sig_image_pil, orig_w * scale, orig_h * scale
+
+
+@lru_cache(maxsize=32)
+def _prepared_signature(member_key, location, max_width, max_height, stamp):
+    """
+    Signature for (member_key, location), trimmed, downscaled for a
+    max_width x max_height point box and PNG-encoded. Returns
+    (png_bytes, final_w, final_h) with sizes in points, or None if nothing
+    is assigned. Crop, resample and encode run once per signature and
+    box size instead of once per generated PDF.
+    """
+    from PIL import Image
+
+    sig_image_pil = get_signature_for_member_location(member_key, location)
+    if sig_image_pil is None:
+        return None
+
+    sig_image_pil, final_w, final_h = _fit_signature(sig_image_pil, max_width, max_height)
+
+    # thumbnail() only ever shrinks, and keeps the aspect ratio
+    sig_image_pil.thumbnail(
+        (
+            max(1, round(final_w * SIGNATURE_OVERSAMPLE)),
+            max(1, round(final_h * SIGNATURE_OVERSAMPLE)),
+        ),
+        Image.LANCZOS,
+    )
+
+    # reportlab decodes this PNG and re-deflates the pixels into the PDF's
+    # own image stream, so spend as little as possible on the PNG itself.
+    buf = io.BytesIO()
+    sig_image_pil.save(buf, format='PNG', optimize=False, compress_level=1)
+    return buf.getvalue(), final_w, final_h
+
+
+def _get_prepared_signature(member_key, location, max_width, max_height):
+    return _prepared_signature(
+        member_key, location, max_width, max_height, _signatures_stamp()
+    )
+
 
 # ------------------------------------------------
 # DRAW SIGNATURE IMAGE ON CANVAS
 # ------------------------------------------------
 def _draw_signature_image(c, sig_image_pil, x, y, max_width=150, max_height=40):
     """
-    Draw a PIL Image signature on the canvas at the specified position.
+    Draw a signature on the canvas at the specified position.
     
     Args:
         c: reportlab canvas
-        sig_image_pil: PIL Image object containing the signature
+        sig_image_pil: PIL Image object, or a (png_bytes, final_w, final_h)
+                       tuple from _prepared_signature for this same box
         x: left edge x-coordinate (in points)
         y: bottom edge y-coordinate (in points)
         max_width: maximum width in points (default 150pt ~ 2 inches)
@@ -53,39 +579,30 @@ def _draw_signature_image(c, sig_image_pil, x, y, max_width=150, max_height=40):
     if sig_image_pil is None:
         return
 
+    if isinstance(sig_image_pil, tuple) and isinstance(c, _StreamCanvas):
+        png_bytes, final_w, final_h = sig_image_pil
+        c.draw_png(png_bytes, x + (max_width - final_w) / 2.0, y, final_w, final_h)
+        return
+
     from io import BytesIO
+    from reportlab.lib.utils import ImageReader
 
-    # Trim transparent padding so signatures look like real ink on the line
-    try:
-        if sig_image_pil.mode in ("RGBA", "LA") or ("transparency" in sig_image_pil.info):
-            alpha = sig_image_pil.split()[-1]
-            bbox = alpha.getbbox()
-            if bbox:
-                sig_image_pil = sig_image_pil.crop(bbox)
-    except Exception:
-        pass
+    if isinstance(sig_image_pil, tuple):
+        # Prepared signature: already trimmed, scaled and encoded
+        png_bytes, final_w, final_h = sig_image_pil
+        buf = BytesIO(png_bytes)
+    else:
+        sig_image_pil, final_w, final_h = _fit_signature(sig_image_pil, max_width, max_height)
+
+        # Save to temporary buffer as PNG (fast deflate; reportlab re-encodes it)
+        buf = BytesIO()
+        sig_image_pil.save(buf, format='PNG', optimize=False, compress_level=1)
+        buf.seek(0)
 
-    # Get original dimensions
-    orig_w, orig_h = sig_image_pil.size
-    
-    # Calculate scaling to fit within max dimensions
-    scale_w = max_width / orig_w
-    scale_h = max_height / orig_h
-    scale = min(scale_w, scale_h)
-    
-    # Calculate final dimensions
-    final_w = orig_w * scale
-    final_h = orig_h * scale
-    
     # Center horizontally within max_width
     x_offset = (max_width - final_w) / 2.0
     final_x = x + x_offset
     
-    # Save to temporary buffer as PNG
-    buf = BytesIO()
-    sig_image_pil.save(buf, format='PNG')
-    buf.seek(0)
-    
     # Draw on canvas
     c.drawImage(
         ImageReader(buf),
@@ -98,32 +615,44 @@ def _draw_signature_image(c, sig_image_pil, x, y, max_width=150, max_height=40):
 
 
 # ------------------------------------------------
-# FLATTEN PDF  (UNCHANGED ORIGINAL)
+# FLATTEN PDF
 # ------------------------------------------------
+def _flatten_single_page_pdf(reader):
+    """
+    Fast path for the one-page forms this app produces: flatten page 0
+    straight into a fresh writer. A fresh PdfWriter never carries the
+    source's /AcroForm (add_page only copies the page), so there is
+    nothing to probe or delete on the root.
+    """
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    _flatten_page(writer.add_page(reader.pages[0]), writer)
+    return writer
+
+
 def flatten_pdf(path):
+    """
+    Flatten a PDF in place. The PG-13 renderers flatten inline while
+    writing; this is kept for external callers with an existing file.
+    """
+    from pypdf import PdfReader, PdfWriter
+
     try:
         reader = PdfReader(path)
-        writer = PdfWriter()
 
-        for page in reader.pages:
-            if "/Annots" in page:
-                del page["/Annots"]
+        if len(reader.pages) == 1:
+            writer = _flatten_single_page_pdf(reader)
+        else:
+            writer = PdfWriter()
 
-            contents = page.get("/Contents")
-            if isinstance(contents, list):
-                merged = b""
-                for obj in contents:
-                    merged += obj.get_data()
-                page["/Contents"] = writer._add_object(merged)
+            for page in reader.pages:
+                _flatten_page(writer.add_page(page), writer)
 
-            if "/Rotate" in page:
-                del page["/Rotate"]
-
-            writer.add_page(page)
-
-        if "/AcroForm" in writer._root_object:
-            del writer._root_object["/AcroForm"]
+            if "/AcroForm" in writer.root_object:
+                del writer.root_object["/AcroForm"]
 
+        # Temp file + rename: an interrupted write never truncates the original
         tmp = path + ".flat"
         with open(tmp, "wb") as f:
             writer.write(f)
@@ -155,7 +684,7 @@ def _draw_centered_certifying_officer(
         return
 
     # IMPORTANT: measure underline width using the SAME font size used to draw it
-    sig_line_w = c.stringWidth(sig_line_text, FONT_NAME, sig_line_font_size)
+    sig_line_w = _sw(sig_line_text, FONT_NAME, sig_line_font_size)
     sig_mid_x = sig_line_left_x + (sig_line_w / 2.0)
 
     c.drawCentredString(sig_mid_x, sig_line_y + y_above_line, name)
@@ -187,23 +716,27 @@ def _draw_pg13_verifying_official_signature(c, member_key):
     'SIGNATURE OF VERIFYING OFFICIAL' box on the PG-13 template.
     ADJUSTED: Raised higher for better positioning in box.
     """
-    sig_image = get_signature_for_member_location(member_key, 'pg13_verifying_official')
-    if sig_image is None:
-        return
-
     # Bottom-right signature box bounds
     box_left_x = 322.0
     box_right_x = 570.0
     # ADJUSTED: Raised UP 4 more pts (was 64.0, now 68.0)
     sig_bottom_y = 68.0
+    max_width = box_right_x - box_left_x
+    max_height = 30
+
+    sig = _get_prepared_signature(
+        member_key, 'pg13_verifying_official', max_width, max_height
+    )
+    if sig is None:
+        return
 
     _draw_signature_image(
         c,
-        sig_image,
+        sig,
         x=box_left_x,
         y=sig_bottom_y,
-        max_width=(box_right_x - box_left_x),
-        max_height=30
+        max_width=max_width,
+        max_height=max_height
     )
 
 
@@ -220,6 +753,194 @@ def _fmt_mmddyyyy(date_yyyymmdd: str) -> str:
     return s
 
 
+# ------------------------------------------------
+# INTERNAL HELPER: Format dates for form text / filenames
+# ------------------------------------------------
+def _mdy(d):
+    """MM/DD/YYYY without going through strftime's locale machinery."""
+    return f"{d.month:02d}/{d.day:02d}/{d.year:04d}"
+
+
+def _mdy_fn(d):
+    """MM-DD-YYYY, the filename-safe variant of _mdy."""
+    return f"{d.month:02d}-{d.day:02d}-{d.year:04d}"
+
+
+# ------------------------------------------------
+# SHARED RENDER POOL
+# ------------------------------------------------
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool():
+    """One executor for every member/ship instead of spawning threads per call."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ThreadPoolExecutor(
+                max_workers=max(2, os.cpu_count() or 2),
+                thread_name_prefix="pg13",
+            )
+        return _POOL
+
+
+def _shutdown_pool():
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=True)
+            _POOL = None
+
+
+def _forget_pool_after_fork():
+    # The parent's worker threads do not exist in a forked child
+    global _POOL, _POOL_LOCK
+    _POOL = None
+    _POOL_LOCK = threading.Lock()
+
+
+atexit.register(_shutdown_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pool_after_fork)
+
+
+# ------------------------------------------------
+# SHARED PG-13 RENDERER
+# ------------------------------------------------
+# One overlay buffer per thread, rewound for each render instead of
+# allocating (and growing) a fresh BytesIO per PDF.
+_tls = threading.local()
+
+
+def _overlay_buffer():
+    buf = getattr(_tls, "buf", None)
+    if buf is None:
+        buf = _tls.buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
+
+def _draw_pg13_overlay(
+    c,
+    identity,
+    member_key,
+    cert_date,
+    cert_name,
+    draw_content,
+    sig_y,
+    bottom_line_y,
+):
+    """Draw the member-specific part of a PG-13 onto c (either canvas kind)."""
+    # Member identity
+    c.setFont(FONT_NAME, 11)
+    c.drawString(39, 41, identity)
+
+    # Mission event lines must match NAVPERS template (10pt)
+    c.setFont(FONT_NAME, 10)
+    draw_content(c)
+
+    # SIGNATURE AREAS
+    # Underlines and captions come from the stamped template (sig_layout);
+    # only the date, signature and officer name are drawn per form.
+    sig_left_x = _SIG_LEFT_X
+    sig_line_w = _sw(_SIG_LINE_TEXT, FONT_NAME, _SIG_LINE_FONT_SIZE)
+
+    # Date aligned to right edge of underline (MM/DD/YYYY)
+    sig_date = _fmt_mmddyyyy(cert_date)
+    if sig_date:
+        c.setFont(FONT_NAME, 10)
+        sig_right_x = sig_left_x + sig_line_w
+        date_w = _sw(sig_date, FONT_NAME, 10)
+        c.drawString(sig_right_x - date_w, sig_y + 2, sig_date)
+
+    # CERTIFYING OFFICIAL signature at same height as date
+    sig = _get_prepared_signature(member_key, 'pg13_certifying_official', 170, 35)
+    if sig is not None:
+        # ADJUSTED: Lower signature DOWN for better positioning
+        sig_bottom_y = sig_y - 2
+        _draw_signature_image(
+            c,
+            sig,
+            sig_left_x - 10,
+            sig_bottom_y,
+            max_width=170,
+            max_height=35
+        )
+
+    # ✅ Certifying officer name centered over underline
+    c.setFont(FONT_NAME, 11)
+    _draw_centered_certifying_officer(
+        c,
+        sig_left_x,
+        bottom_line_y,
+        cert_name,
+        y_above_line=7.0,
+        sig_line_text=_SIG_LINE_TEXT,
+        sig_line_font_size=_SIG_LINE_FONT_SIZE,
+    )
+
+    # NOTE: PG-13 member signature disabled (user requested nothing above the member name line)
+
+    # ✅ PG-13 DATE box (YYYYMMDD)
+    _draw_pg13_certifier_date(c, cert_date)
+
+    # ✅ PG-13 verifying official signature (bottom-right box)
+    _draw_pg13_verifying_official_signature(c, member_key)
+
+
+def _render_pg13(
+    outpath,
+    identity,
+    member_key,
+    cert_date,
+    cert_name,
+    draw_content,
+    sig_y=499.5,
+    bottom_line_y=427.5,
+):
+    """
+    Draw everything a PG-13 overlay has in common (identity, certifying
+    official block, DATE box, verifying signature) and write it over the
+    template. draw_content(c) draws the mission lines; the font is already
+    set to the 10pt mission size when it is called.
+
+    sig_y / bottom_line_y are the baselines of the "Certifying Official &
+    Date" and "FI MI Last Name" underlines.
+    """
+    args = (identity, member_key, cert_date, cert_name, draw_content, sig_y, bottom_line_y)
+    sig_layout = (sig_y, bottom_line_y)
+
+    # Usual case: operators written straight into the template page
+    stamp = _template_stamp()
+    font_resource = _template_text_font(stamp, sig_layout)
+    if font_resource is not None:
+        sc = _StreamCanvas(font_resource)
+        try:
+            _draw_pg13_overlay(sc, *args)
+        except _DirectFallback as e:
+            log(f"PG-13 OVERLAY VIA REPORTLAB ({e}) → {os.path.basename(outpath)}")
+        else:
+            _write_stream_over_template(sc, outpath, stamp, sig_layout)
+            return
+
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+
+    buf = _overlay_buffer()
+    _register_font()
+    # The overlay is parsed straight back by pypdf, never stored: skip the
+    # deflate here and the inflate in the merge.
+    c = canvas.Canvas(buf, pagesize=letter, pageCompression=0)
+    _draw_pg13_overlay(c, *args)
+    c.save()
+    buf.seek(0)
+
+    # MERGE WITH TEMPLATE (the reader is done with buf before this returns)
+    _write_over_template(buf, outpath, sig_layout=sig_layout)
+
+
 # ------------------------------------------------
 # 🔹 NEW: CONSOLIDATED ALL MISSIONS (ALL SHIPS ON ONE FORM)
 # ------------------------------------------------
@@ -236,7 +957,6 @@ def make_consolidated_all_missions_pdf(
     Creates a SINGLE PG-13 form with ALL missions across ALL ships for a member.
     Filename date range uses OVERALL SHEET reporting range when provided.
     """
-
     if not ship_groups:
         return
 
@@ -247,6 +967,10 @@ def make_consolidated_all_missions_pdf(
     # Per-member signatures use the member_key (RATE LAST,FIRST) as the lookup key.
     member_key = name
 
+    # Certifier info is read once per form, not once per field
+    cert_date = get_certifying_date_yyyymmdd()
+    cert_name = get_certifying_officer_name_pg13()
+
     # Sort ships alphabetically for consistency
     sorted_ships = sorted(ship_groups.items())
 
@@ -265,14 +989,14 @@ def make_consolidated_all_missions_pdf(
     # - If overall_start/overall_end are given -> use those (sheet range)
     # - Else -> fall back to first/last mission period
     if overall_start and overall_end:
-        s_fn = overall_start.strftime("%m-%d-%Y")
-        e_fn = overall_end.strftime("%m-%d-%Y")
+        s_fn = _mdy_fn(overall_start)
+        e_fn = _mdy_fn(overall_end)
     else:
         all_periods_sorted = sorted(all_periods, key=lambda g: g["start"])
         first_period = all_periods_sorted[0]
         last_period = all_periods_sorted[-1]
-        s_fn = first_period["start"].strftime("%m-%d-%Y")
-        e_fn = last_period["end"].strftime("%m-%d-%Y")
+        s_fn = _mdy_fn(first_period["start"])
+        e_fn = _mdy_fn(last_period["end"])
 
     # ✅ Desired prefix format: "STG1_HATTEN,FRANK__..."
     prefix = f"{rate}_{last},{first}" if rate else f"{last},{first}"
@@ -281,148 +1005,57 @@ def make_consolidated_all_missions_pdf(
 
     outpath = os.path.join(SEA_PAY_PG13_FOLDER, filename)
 
-    # Create overlay with all ships and their periods
-    buf = io.BytesIO()
-    c = canvas.Canvas(buf, pagesize=letter)
-    c.setFont(FONT_NAME, FONT_SIZE)
-
-    # HEADER BLOCK
-    c.drawString(39, 689, "AFLOAT TRAINING GROUP SAN DIEGO (UIC. 49365)")
-    c.drawString(373, 671, "X")
-    c.setFont(FONT_NAME, 8)
-    c.drawString(39, 650, "ENTITLEMENT")
-    c.drawString(345, 641, "OPNAVINST 7220.14")
-
-    # Member identity
-    c.setFont(FONT_NAME, 11)
     identity = f"{rate} {last}, {first}" if rate else f"{last}, {first}"
-    c.drawString(39, 41, identity)
-
-    # MAIN TEXT BLOCK - ALL SHIPS AND PERIODS
-    # Mission event lines must match NAVPERS template (10pt)
-    c.setFont(FONT_NAME, 10)
 
     y = 595
     line_spacing = 12
-    current_line = 0
-
-    for ship, periods in sorted_ships:
-        periods_sorted = sorted(periods, key=lambda g: g["start"])
-
-        for g in periods_sorted:
-            s = g["start"].strftime("%m/%d/%Y")
-            e = g["end"].strftime("%m/%d/%Y")
 
-            c.drawString(
-                38.8,
-                y - (current_line * line_spacing),
-                f"____. REPORT CAREER SEA PAY FROM {s} TO {e}."
-            )
-            current_line += 1
+    # Period lines + one ship line per ship + a blank line between ships
+    content_lines = total_periods + 2 * len(sorted_ships) - 1
 
-        c.drawString(
-            64,
-            y - (current_line * line_spacing),
-            f"Member performed eight continuous hours per day on-board: "
-            f"{ship.upper()} Category A vessel."
-        )
-        current_line += 1
+    def draw_content(c):
+        # MAIN TEXT BLOCK - ALL SHIPS AND PERIODS
+        # One text object for every mission line (single BT/ET block)
+        text = c.beginText()
+        current_line = 0
 
-        if ship != sorted_ships[-1][0]:
-            current_line += 1
+        for ship, periods in sorted_ships:
+            periods_sorted = sorted(periods, key=lambda g: g["start"])
 
-    # SIGNATURE AREAS
-    content_height = current_line * line_spacing
-    base_sig_y = 499.5
-    sig_y = min(base_sig_y, 595 - content_height - 40)
-
-    sig_left_x = 356.26
-    sig_line_text = "____________________________________"
-    sig_line_font_size = 8
+            for g in periods_sorted:
+                s = _mdy(g["start"])
+                e = _mdy(g["end"])
 
-    # Calculate center from underline width (same font size used to draw it)
-    sig_line_w = c.stringWidth(sig_line_text, FONT_NAME, sig_line_font_size)
-    sig_mid_x = sig_left_x + (sig_line_w / 2.0)
-
-    c.setFont(FONT_NAME, sig_line_font_size)
-    c.drawString(sig_left_x, sig_y, sig_line_text)
-    c.setFont(FONT_NAME, 10)
+                text.setTextOrigin(38.8, y - (current_line * line_spacing))
+                text.textLine(f"____. REPORT CAREER SEA PAY FROM {s} TO {e}.")
+                current_line += 1
 
-    # Date aligned to right edge of underline (MM/DD/YYYY)
-    sig_date = _fmt_mmddyyyy(get_certifying_date_yyyymmdd())
-    if sig_date:
-        c.setFont(FONT_NAME, 10)
-        sig_right_x = sig_left_x + sig_line_w
-        date_w = c.stringWidth(sig_date, FONT_NAME, 10)
-        c.drawString(sig_right_x - date_w, sig_y + 2, sig_date)
-    c.setFont(FONT_NAME, 10)
-    c.drawCentredString(sig_mid_x, sig_y - 12, "Certifying Official & Date")
-
-    # NEW: Draw CERTIFYING OFFICIAL signature at same height as date
-    sig_image = get_signature_for_member_location(member_key, 'pg13_certifying_official')
-    if sig_image is not None:
-        # ADJUSTED: Lower signature DOWN for better positioning
-        sig_bottom_y = sig_y - 2  # Lowered DOWN 4pts (was +2, now -2)
-        _draw_signature_image(
-            c,
-            sig_image,
-            sig_left_x - 10,
-            sig_bottom_y,
-            max_width=170,
-            max_height=35
-        )
+            text.setTextOrigin(64, y - (current_line * line_spacing))
+            text.textLine(
+                f"Member performed eight continuous hours per day on-board: "
+                f"{ship.upper()} Category A vessel."
+            )
+            current_line += 2
 
-    # Tighten vertical spacing (was sig_y - 72, too large)
-    bottom_line_y = sig_y - 52
-    c.setFont(FONT_NAME, sig_line_font_size)
+        c.drawText(text)
 
-    c.drawString(sig_left_x, bottom_line_y, sig_line_text)
+    # Signature block moves up the page only if the mission text runs long
+    content_height = content_lines * line_spacing
+    base_sig_y = 499.5
+    sig_y = min(base_sig_y, 595 - content_height - 40)
 
-    # ✅ Certifying officer name centered over underline
-    c.setFont(FONT_NAME, 11)
-    certifying_officer_name = get_certifying_officer_name_pg13()
-    _draw_centered_certifying_officer(
-        c,
-        sig_left_x,
-        bottom_line_y,
-        certifying_officer_name,
-        y_above_line=7.0,
-        sig_line_text=sig_line_text,
-        sig_line_font_size=sig_line_font_size,
+    _render_pg13(
+        outpath,
+        identity,
+        member_key,
+        cert_date,
+        cert_name,
+        draw_content,
+        sig_y=sig_y,
+        # Tighten vertical spacing (was sig_y - 72, too large)
+        bottom_line_y=sig_y - 52,
     )
 
-    # FI MI Last Name centered under underline
-    c.setFont(FONT_NAME, 10)
-    c.drawCentredString(sig_mid_x, bottom_line_y - 12.3, "FI MI Last Name")
-    # NOTE: PG-13 member signature disabled (user requested nothing above the member name line)
-
-    c.setFont(FONT_NAME, 10)
-    c.drawString(38.8, 83, "SEA PAY CERTIFIER")
-    c.drawString(503.5, 40, "USN AD")
-
-    # ✅ PG-13 DATE box (YYYYMMDD)
-    _draw_pg13_certifier_date(c, get_certifying_date_yyyymmdd())
-
-    # ✅ PG-13 verifying official signature (bottom-right box)
-    _draw_pg13_verifying_official_signature(c, name)
-
-    c.save()
-    buf.seek(0)
-
-    # MERGE WITH TEMPLATE
-    template = PdfReader(TEMPLATE)
-    overlay = PdfReader(buf)
-    base = template.pages[0]
-    base.merge_page(overlay.pages[0])
-
-    writer = PdfWriter()
-    writer.add_page(base)
-
-    with open(outpath, "wb") as f:
-        writer.write(f)
-
-    flatten_pdf(outpath)
-
     ship_count = len(sorted_ships)
     log(f"CREATED ALL MISSIONS PG-13 → {filename} ({ship_count} ships, {total_periods} periods on 1 form)")
 
@@ -435,13 +1068,19 @@ def make_consolidated_pdf_for_ship(ship, periods, name):
         return
 
     rate, last, first = resolve_identity(name)
+    # Per-member signatures use the member_key (RATE LAST,FIRST) as the lookup key.
+    member_key = f"{rate} {last},{first}"
     periods_sorted = sorted(periods, key=lambda g: g["start"])
 
+    # Certifier info is read once per form, not once per field
+    cert_date = get_certifying_date_yyyymmdd()
+    cert_name = get_certifying_officer_name_pg13()
+
     first_period = periods_sorted[0]
     last_period = periods_sorted[-1]
 
-    s_fn = first_period["start"].strftime("%m-%d-%Y")
-    e_fn = last_period["end"].strftime("%m-%d-%Y")
+    s_fn = _mdy_fn(first_period["start"])
+    e_fn = _mdy_fn(last_period["end"])
 
     filename = (
         f"{rate}_{last}_{first}"
@@ -451,116 +1090,29 @@ def make_consolidated_pdf_for_ship(ship, periods, name):
 
     outpath = os.path.join(SEA_PAY_PG13_FOLDER, filename)
 
-    buf = io.BytesIO()
-    c = canvas.Canvas(buf, pagesize=letter)
-    c.setFont(FONT_NAME, FONT_SIZE)
-
-    c.drawString(39, 689, "AFLOAT TRAINING GROUP SAN DIEGO (UIC. 49365)")
-    c.drawString(373, 671, "X")
-    c.setFont(FONT_NAME, 8)
-    c.drawString(39, 650, "ENTITLEMENT")
-    c.drawString(345, 641, "OPNAVINST 7220.14")
-
-    c.setFont(FONT_NAME, 11)
     identity = f"{rate} {last}, {first}" if rate else f"{last}, {first}"
-    c.drawString(39, 41, identity)
-
-    # Mission event lines must match NAVPERS template (10pt)
-    c.setFont(FONT_NAME, 10)
-
-    y = 595
-    line_spacing = 12
-
-    for idx, g in enumerate(periods_sorted):
-        s = g["start"].strftime("%m/%d/%Y")
-        e = g["end"].strftime("%m/%d/%Y")
-        c.drawString(38.8, y - (idx * line_spacing),
-                    f"____. REPORT CAREER SEA PAY FROM {s} TO {e}.")
-
-    ship_line_y = y - (len(periods_sorted) * line_spacing) - 12
-    c.drawString(
-        64,
-        ship_line_y,
-        f"Member performed eight continuous hours per day on-board: "
-        f"{ship.upper()} Category A vessel."
-    )
-
-    sig_left_x = 356.26
-    top_sig_y = 499.5
-    bottom_line_y = 427.5
-
-    sig_line_text = "____________________________________"
-    sig_line_font_size = 8
-    sig_line_w = c.stringWidth(sig_line_text, FONT_NAME, sig_line_font_size)
-    sig_mid_x = sig_left_x + (sig_line_w / 2.0)
-
-    c.setFont(FONT_NAME, sig_line_font_size)
-    c.drawString(sig_left_x, top_sig_y, sig_line_text)
-    c.setFont(FONT_NAME, 10)
-
-    # Date aligned to right edge of underline (MM/DD/YYYY)
-    sig_date = _fmt_mmddyyyy(get_certifying_date_yyyymmdd())
-    if sig_date:
-        c.setFont(FONT_NAME, 10)
-        sig_right_x = sig_left_x + sig_line_w
-        date_w = c.stringWidth(sig_date, FONT_NAME, 10)
-        c.drawString(sig_right_x - date_w, top_sig_y + 2, sig_date)
-    c.setFont(FONT_NAME, 10)
-    c.drawCentredString(sig_mid_x, top_sig_y - 12, "Certifying Official & Date")
-    
-    # NEW: Draw CERTIFYING OFFICIAL signature at same height as date
-    sig_image = get_signature_for_member_location(member_key, 'pg13_certifying_official')
-    if sig_image is not None:
-        sig_bottom_y = top_sig_y - 2  # ADJUSTED: Lowered DOWN
-        _draw_signature_image(c, sig_image, sig_left_x - 10, sig_bottom_y, max_width=170, max_height=35)
-    
-    c.setFont(FONT_NAME, sig_line_font_size)
-
-    c.drawString(sig_left_x, bottom_line_y, sig_line_text)
-
-    # ✅ Certifying officer name centered + lower
-    c.setFont(FONT_NAME, 11)
-    certifying_officer_name = get_certifying_officer_name_pg13()
-    _draw_centered_certifying_officer(
-        c,
-        sig_left_x,
-        bottom_line_y,
-        certifying_officer_name,
-        y_above_line=7.0,
-        sig_line_text=sig_line_text,
-        sig_line_font_size=sig_line_font_size,
-    )
-
-    # FI MI Last Name centered
-    c.setFont(FONT_NAME, 10)
-    c.drawCentredString(sig_mid_x, bottom_line_y - 12.3, "FI MI Last Name")
-    # NOTE: PG-13 member signature disabled (user requested nothing above the member name line)
-
-    c.setFont(FONT_NAME, 10)
-    c.drawString(38.8, 83, "SEA PAY CERTIFIER")
-    c.drawString(503.5, 40, "USN AD")
-
-    # ✅ PG-13 DATE box (YYYYMMDD)
-    _draw_pg13_certifier_date(c, get_certifying_date_yyyymmdd())
-
-    # ✅ PG-13 verifying official signature (bottom-right box)
-    _draw_pg13_verifying_official_signature(c, name)
-
-    c.save()
-    buf.seek(0)
 
-    template = PdfReader(TEMPLATE)
-    overlay = PdfReader(buf)
-    base = template.pages[0]
-    base.merge_page(overlay.pages[0])
+    def draw_content(c):
+        y = 595
+        line_spacing = 12
 
-    writer = PdfWriter()
-    writer.add_page(base)
+        # One text object for every mission line (single BT/ET block)
+        text = c.beginText(38.8, y)
+        text.setLeading(line_spacing)
+        for g in periods_sorted:
+            s = _mdy(g["start"])
+            e = _mdy(g["end"])
+            text.textLine(f"____. REPORT CAREER SEA PAY FROM {s} TO {e}.")
 
-    with open(outpath, "wb") as f:
-        writer.write(f)
+        ship_line_y = y - (len(periods_sorted) * line_spacing) - 12
+        text.setTextOrigin(64, ship_line_y)
+        text.textLine(
+            f"Member performed eight continuous hours per day on-board: "
+            f"{ship.upper()} Category A vessel."
+        )
+        c.drawText(text)
 
-    flatten_pdf(outpath)
+    _render_pg13(outpath, identity, member_key, cert_date, cert_name, draw_content)
 
     total_periods = len(periods_sorted)
     log(f"CREATED CONSOLIDATED PG-13 → {filename} ({total_periods} periods on 1 form)")
@@ -569,49 +1121,29 @@ def make_consolidated_pdf_for_ship(ship, periods, name):
 # ------------------------------------------------
 # ORIGINAL FORMAT — ONE PG-13 PER PERIOD
 # ------------------------------------------------
-def make_pdf_for_ship(ship, periods, name, consolidate=False):
-    if not periods:
-        return
-
-    if consolidate and len(periods) > 1:
-        make_consolidated_pdf_for_ship(ship, periods, name)
-        return
-
-    rate, last, first = resolve_identity(name)
-    periods_sorted = sorted(periods, key=lambda g: g["start"])
-
-    for g in periods_sorted:
-        s = g["start"].strftime("%m/%d/%Y")
-        e = g["end"].strftime("%m/%d/%Y")
-
-        s_fn = s.replace("/", "-")
-        e_fn = e.replace("/", "-")
-
-        filename = (
-            f"{rate}_{last}_{first}"
-            f"__SEA_PAY_PG13__{ship.upper()}__{s_fn}_TO_{e_fn}.pdf"
-        )
-        filename = filename.replace(" ", "_")
-
-        outpath = os.path.join(SEA_PAY_PG13_FOLDER, filename)
+def _render_single_period(ship, g, rate, last, first, member_key, cert_date, cert_name):
+    """
+    Render the PG-13 for ONE period and return its filename.
+    make_pdf_for_ship runs one of these per period on a thread pool; the
+    certifier date/name are resolved once by the caller for all periods.
+    """
+    s = _mdy(g["start"])
+    e = _mdy(g["end"])
 
-        buf = io.BytesIO()
-        c = canvas.Canvas(buf, pagesize=letter)
-        c.setFont(FONT_NAME, FONT_SIZE)
+    s_fn = _mdy_fn(g["start"])
+    e_fn = _mdy_fn(g["end"])
 
-        c.drawString(39, 689, "AFLOAT TRAINING GROUP SAN DIEGO (UIC. 49365)")
-        c.drawString(373, 671, "X")
-        c.setFont(FONT_NAME, 8)
-        c.drawString(39, 650, "ENTITLEMENT")
-        c.drawString(345, 641, "OPNAVINST 7220.14")
+    filename = (
+        f"{rate}_{last}_{first}"
+        f"__SEA_PAY_PG13__{ship.upper()}__{s_fn}_TO_{e_fn}.pdf"
+    )
+    filename = filename.replace(" ", "_")
 
-        c.setFont(FONT_NAME, 11)
-        identity = f"{rate} {last}, {first}" if rate else f"{last}, {first}"
-        c.drawString(39, 41, identity)
+    outpath = os.path.join(SEA_PAY_PG13_FOLDER, filename)
 
-        # Mission event lines must match NAVPERS template (10pt)
-        c.setFont(FONT_NAME, 10)
+    identity = f"{rate} {last}, {first}" if rate else f"{last}, {first}"
 
+    def draw_content(c):
         y = 595
         c.drawString(38.8, y, f"____. REPORT CAREER SEA PAY FROM {s} TO {e}.")
 
@@ -622,80 +1154,55 @@ def make_pdf_for_ship(ship, periods, name, consolidate=False):
             f"{ship.upper()} Category A vessel."
         )
 
-        sig_left_x = 356.26
-        top_sig_y = 499.5
-        bottom_line_y = 427.5
-
-        sig_line_text = "____________________________________"
-        sig_line_font_size = 8
-        sig_line_w = c.stringWidth(sig_line_text, FONT_NAME, sig_line_font_size)
-        sig_mid_x = sig_left_x + (sig_line_w / 2.0)
-
-        c.setFont(FONT_NAME, sig_line_font_size)
-        c.drawString(sig_left_x, top_sig_y, sig_line_text)
-        c.setFont(FONT_NAME, 10)
-
-        # Date aligned to right edge of underline (MM/DD/YYYY)
-        sig_date = _fmt_mmddyyyy(get_certifying_date_yyyymmdd())
-        if sig_date:
-            c.setFont(FONT_NAME, 10)
-            sig_right_x = sig_left_x + sig_line_w
-            date_w = c.stringWidth(sig_date, FONT_NAME, 10)
-            c.drawString(sig_right_x - date_w, top_sig_y + 2, sig_date)
-        c.setFont(FONT_NAME, 10)
-        c.drawCentredString(sig_mid_x, top_sig_y - 12, "Certifying Official & Date")
-        
-        # NEW: Draw CERTIFYING OFFICIAL signature at same height as date
-        sig_image = get_signature_for_member_location(member_key, 'pg13_certifying_official')
-        if sig_image is not None:
-            sig_bottom_y = top_sig_y - 2  # ADJUSTED: Lowered DOWN
-            _draw_signature_image(c, sig_image, sig_left_x - 10, sig_bottom_y, max_width=170, max_height=35)
-        
-        c.setFont(FONT_NAME, sig_line_font_size)
-
-        c.drawString(sig_left_x, bottom_line_y, sig_line_text)
-
-        # ✅ Certifying officer name centered + lower
-        c.setFont(FONT_NAME, 11)
-        certifying_officer_name = get_certifying_officer_name_pg13()
-        _draw_centered_certifying_officer(
-            c,
-            sig_left_x,
-            bottom_line_y,
-            certifying_officer_name,
-            y_above_line=7.0,
-            sig_line_text=sig_line_text,
-            sig_line_font_size=sig_line_font_size,
-        )
+    _render_pg13(outpath, identity, member_key, cert_date, cert_name, draw_content)
 
-        # FI MI Last Name centered
-        c.setFont(FONT_NAME, 10)
-        c.drawCentredString(sig_mid_x, bottom_line_y - 12.3, "FI MI Last Name")
-        # NOTE: PG-13 member signature disabled (user requested nothing above the member name line)
-        
-        c.setFont(FONT_NAME, 10)
-        c.drawString(38.8, 83, "SEA PAY CERTIFIER")
-        c.drawString(503.5, 40, "USN AD")
+    return filename
 
-        # ✅ PG-13 DATE box (YYYYMMDD)
-        _draw_pg13_certifier_date(c, get_certifying_date_yyyymmdd())
 
-        # ✅ PG-13 verifying official signature (bottom-right box)
-        _draw_pg13_verifying_official_signature(c, name)
+def make_pdf_for_ship(ship, periods, name, consolidate=False):
+    if not periods:
+        return
 
-        c.save()
-        buf.seek(0)
+    if consolidate and len(periods) > 1:
+        make_consolidated_pdf_for_ship(ship, periods, name)
+        return
 
-        template = PdfReader(TEMPLATE)
-        overlay = PdfReader(buf)
-        base = template.pages[0]
-        base.merge_page(overlay.pages[0])
+    rate, last, first = resolve_identity(name)
+    # Per-member signatures use the member_key (RATE LAST,FIRST) as the lookup key.
+    member_key = f"{rate} {last},{first}"
+    periods_sorted = sorted(periods, key=lambda g: g["start"])
 
-        writer = PdfWriter()
-        writer.add_page(base)
+    # Same certifier on every period's form
+    cert_date = get_certifying_date_yyyymmdd()
+    cert_name = get_certifying_officer_name_pg13()
+
+    # Each period is an independent PDF. Threads rather than processes:
+    # forking the (multithreaded) Flask worker is unsafe, and renders share
+    # the parsed template, signature and font caches in this process.
+    if len(periods_sorted) == 1:
+        filename = _render_single_period(
+            ship, periods_sorted[0], rate, last, first, member_key,
+            cert_date, cert_name,
+        )
+        log(f"CREATED → {filename}")
+        return
 
-        with open(outpath, "wb") as f:
-            writer.write(f)
+    pool = _pool()
+    futures = [
+        pool.submit(
+            _render_single_period,
+            ship, g, rate, last, first, member_key, cert_date, cert_name,
+        )
+        for g in periods_sorted
+    ]
+    # Collected in period order so the log reads like the serial loop's.
+    # Like that loop, stop at the first failure: renders that have not
+    # started yet are cancelled before the error propagates.
+    try:
+        for fut in futures:
+            log(f"CREATED → {fut.result()}")
+    except BaseException:
+        for fut in futures:
+            fut.cancel()
+        raise
 
-        flatten_pdf(outpath)
-        log(f"CREATED → {filename}")
@@ -2,6 +2,7 @@ import csv
 import os
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 from app.core.config import RATE_FILE
 from app.core.logger import log
@@ -37,36 +38,74 @@ def load_rates():
     return rates
 
 
-RATES = load_rates()
+_PAREN_RE = re.compile(r"\(.*?\)")
+_NON_ALPHA_RE = re.compile(r"[^A-Z ]")
+
+
+def normalize_for_id(text):
+    t = _PAREN_RE.sub("", text.upper())
+    t = _NON_ALPHA_RE.sub("", t)
+    return " ".join(t.split())
+
+
+def _build_identities(rates):
+    identities = []
+    for key, rate in rates.items():
+        last, first = key.split(",", 1)
+        full_norm = normalize_for_id(f"{first} {last}")
+        identities.append((full_norm, rate, last, first))
+
+    # Exact normalized name -> identity (first CSV row wins, same as the scan)
+    exact = {}
+    for full_norm, rate, last, first in identities:
+        exact.setdefault(full_norm, (rate, last, first))
+    return identities, exact
+
 
-CSV_IDENTITIES = []
-for key, rate in RATES.items():
-    last, first = key.split(",", 1)
+RATES = load_rates()
+CSV_IDENTITIES, _CSV_EXACT = _build_identities(RATES)
 
-    def normalize_for_id(text):
-        t = re.sub(r"\(.*?\)", "", text.upper())
-        t = re.sub(r"[^A-Z ]", "", t)
-        return " ".join(t.split())
 
-    full_norm = normalize_for_id(f"{first} {last}")
-    CSV_IDENTITIES.append((full_norm, rate, last, first))
+def reload_rates():
+    """Re-read the roster CSV and drop every identity memoized from the old one."""
+    global RATES, CSV_IDENTITIES, _CSV_EXACT
+    RATES = load_rates()
+    CSV_IDENTITIES, _CSV_EXACT = _build_identities(RATES)
+    _match_identity.cache_clear()
+    get_rate.cache_clear()
+    return RATES
 
 
 # ------------------------------------------------
 # CSV MATCHING / IDENTITY
 # ------------------------------------------------
 
-def lookup_csv_identity(name):
-    ocr_norm = normalize(name)
+@lru_cache(maxsize=4096)
+def _match_identity(ocr_norm):
+    # The same OCR name repeats across periods and ships in a batch
+    exact = _CSV_EXACT.get(ocr_norm)
+    if exact:
+        return exact, 1.0
+
     best = None
     best_score = 0.0
 
     for csv_norm, rate, last, first in CSV_IDENTITIES:
-        score = SequenceMatcher(None, ocr_norm, csv_norm).ratio()
+        sm = SequenceMatcher(None, ocr_norm, csv_norm)
+        # Cheap upper bounds first: skip rows that cannot beat the best so far
+        if sm.real_quick_ratio() <= best_score or sm.quick_ratio() <= best_score:
+            continue
+        score = sm.ratio()
         if score > best_score:
             best_score = score
             best = (rate, last, first)
 
+    return best, best_score
+
+
+def lookup_csv_identity(name):
+    best, best_score = _match_identity(normalize(name))
+
     if best and best_score >= 0.60:
         rate, last, first = best
         log(f"CSV MATCH ({best_score:.2f}) → {rate} {last},{first}")
@@ -76,6 +115,7 @@ def lookup_csv_identity(name):
     return None
 
 
+@lru_cache(maxsize=4096)
 def get_rate(name):
     parts = normalize(name).split()
     if len(parts) < 2:
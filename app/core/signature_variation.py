@@ -3,11 +3,67 @@ Signature Variation Module - Makes each signature unique per document
 Simulates natural hand-signing variations (position, rotation, scale)
 """
 
+import hashlib
+import math
 import random
-from PIL import Image, ImageDraw, ImageFilter, ImageOps
+import threading
+from collections import OrderedDict
+from PIL import Image, ImageChops, ImageFilter
 import io
 import base64
 
+from app.core.config import SIGNATURE_FAST_ENCODE
+
+
+_IDENTITY_LUT = list(range(256))
+
+
+def _is_grayscale(signature_pil):
+    """True if the signature has no colour."""
+    if signature_pil.mode in ('L', 'LA', '1'):
+        return True
+    if signature_pil.mode in ('RGB', 'RGBA'):
+        r, g, b = signature_pil.convert('RGB').split()
+        return (
+            ImageChops.difference(r, g).getbbox() is None
+            and ImageChops.difference(g, b).getbbox() is None
+        )
+    return False
+
+
+def _variation_transform(size, rotation, scale, origin, pad):
+    """
+    Output size and inverse affine matrix for rotating `size` by `rotation`
+    degrees (expanded like Image.rotate(expand=True)), scaling by `scale`
+    and placing it at `origin` on a canvas `pad` pixels larger.
+    """
+    w, h = size
+    angle = -math.radians(rotation)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+
+    # Bounds of the rotated image, exactly as Image.rotate(expand=True)
+    cx, cy = w / 2.0, h / 2.0
+    xs = [cos_a * (x - cx) + sin_a * (y - cy) for x, y in ((0, 0), (w, 0), (w, h), (0, h))]
+    ys = [-sin_a * (x - cx) + cos_a * (y - cy) for x, y in ((0, 0), (w, 0), (w, h), (0, h))]
+    rot_w = math.ceil(max(xs)) - math.floor(min(xs))
+    rot_h = math.ceil(max(ys)) - math.floor(min(ys))
+
+    new_w = int(rot_w * scale)
+    new_h = int(rot_h * scale)
+    sx = new_w / rot_w
+    sy = new_h / rot_h
+
+    # output (X, Y) -> rotated (u, v) = ((X - ox) / sx, (Y - oy) / sy)
+    # rotated (u, v) -> source about the two centres
+    ox, oy = origin
+    a, b = cos_a / sx, sin_a / sy
+    d, e = -sin_a / sx, cos_a / sy
+    u0, v0 = -ox / sx - rot_w / 2.0, -oy / sy - rot_h / 2.0
+    c = cos_a * u0 + sin_a * v0 + cx
+    f = -sin_a * u0 + cos_a * v0 + cy
+
+    return (new_w + pad, new_h + pad), (a, b, c, d, e, f)
+
 
 def apply_natural_variation(signature_pil, seed=None):
     """
@@ -21,48 +77,140 @@ def apply_natural_variation(signature_pil, seed=None):
     Returns:
         PIL Image with natural variations applied
     """
-    if seed is not None:
-        random.seed(seed)
+    # Private RNG: same sequence as random.seed(seed), but safe to run from
+    # several threads and leaves the global generator alone
+    rng = random.Random(seed)
     
-    # Create a copy to avoid modifying original
-    sig = signature_pil.copy()
+    # Black/grey ink only needs luminance + alpha: half the bytes through
+    # every pass below. Coloured ink keeps all four channels.
+    work_mode = 'LA' if _is_grayscale(signature_pil) else 'RGBA'
+    src = signature_pil if signature_pil.mode == work_mode else signature_pil.convert(work_mode)
+    clear = (255, 0) if work_mode == 'LA' else (255, 255, 255, 0)
     
     # 1. SUBTLE ROTATION (-2° to +2°)
     # Simulates hand angle variation
-    rotation = random.uniform(-2.0, 2.0)
-    sig = sig.rotate(rotation, expand=True, fillcolor=(255, 255, 255, 0))
+    rotation = rng.uniform(-2.0, 2.0)
     
     # 2. SLIGHT SCALE VARIATION (95% to 105%)
     # Simulates pressure/size variation
-    scale = random.uniform(0.95, 1.05)
-    new_width = int(sig.width * scale)
-    new_height = int(sig.height * scale)
-    sig = sig.resize((new_width, new_height), Image.Resampling.LANCZOS)
+    scale = rng.uniform(0.95, 1.05)
     
     # 3. TINY POSITION OFFSET (±2 pixels)
     # Simulates placement variation
-    offset_x = random.randint(-2, 2)
-    offset_y = random.randint(-2, 2)
+    offset_x = rng.randint(-2, 2)
+    offset_y = rng.randint(-2, 2)
     
-    # Create new image with padding for offset
-    padded = Image.new('RGBA', (sig.width + 8, sig.height + 8), (255, 255, 255, 0))
-    padded.paste(sig, (4 + offset_x, 4 + offset_y))
+    # Rotate, scale and place on the 4px-padded canvas in ONE resampling
+    # pass instead of rotate -> resize -> paste (three full-image copies).
+    # Bilinear is plenty for a ±5% scale of a signature that is blurred
+    # and re-rasterized afterwards.
+    size, matrix = _variation_transform(
+        src.size, rotation, scale, (4 + offset_x, 4 + offset_y), pad=8
+    )
+    padded = src.transform(
+        size,
+        Image.Transform.AFFINE,
+        matrix,
+        resample=Image.Resampling.BILINEAR,
+        fillcolor=clear,
+    )
     
     # 4. SUBTLE THICKNESS VARIATION (via slight blur)
     # Simulates ink flow variation
-    blur_amount = random.uniform(0, 0.3)
-    if blur_amount > 0.1:
-        padded = padded.filter(ImageFilter.GaussianBlur(radius=blur_amount))
+    # Radii under ~0.5px are invisible once the PDF is re-rasterized, so only
+    # the top of the range blurs, with a single-pass box blur.
+    blur_amount = rng.uniform(0, 0.6)
+    if blur_amount > 0.5:
+        padded = padded.filter(ImageFilter.BoxBlur(radius=blur_amount))
     
     # 5. SLIGHT OPACITY VARIATION (98% to 100%)
     # Simulates ink consistency
-    opacity = random.uniform(0.98, 1.0)
+    opacity = rng.uniform(0.98, 1.0)
     if opacity < 1.0:
-        alpha = padded.split()[3]
-        alpha = alpha.point(lambda p: int(p * opacity))
-        padded.putalpha(alpha)
+        # One table pass: colour bands unchanged, alpha scaled
+        alpha_lut = [int(p * opacity) for p in range(256)]
+        padded = padded.point(_IDENTITY_LUT * (len(padded.getbands()) - 1) + alpha_lut)
     
-    return padded
+    return padded if padded.mode == 'RGBA' else padded.convert('RGBA')
+
+
+def _signature_fingerprint(signature_pil):
+    """
+    Content fingerprint of a signature image: a blake2b digest of its pixels
+    plus size and mode. The caller's Image is never written to, and an image
+    edited in place simply gets a new fingerprint.
+    """
+    digest = hashlib.blake2b(signature_pil.tobytes(), digest_size=16).digest()
+    return digest, signature_pil.size, signature_pil.mode
+
+
+# One PNG buffer per thread, rewound for each encode
+_tls = threading.local()
+
+
+def _png_buffer():
+    buffer = getattr(_tls, "buffer", None)
+    if buffer is None:
+        buffer = _tls.buffer = io.BytesIO()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return buffer
+
+
+def _encode_png(varied_sig):
+    buffer = _png_buffer()
+    if SIGNATURE_FAST_ENCODE:
+        varied_sig.save(buffer, format='PNG', compress_level=1, optimize=False)
+    else:
+        varied_sig.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+# Varied PNGs keyed by (fingerprint, seed) only, so the cache never keeps
+# a caller's source Image alive
+_VARIED_CACHE_MAX = 512
+_VARIED_CACHE = OrderedDict()
+_VARIED_LOCK = threading.Lock()
+
+
+def _varied_signature_png(signature_pil, fp, seed):
+    key = (fp, seed)
+    with _VARIED_LOCK:
+        png = _VARIED_CACHE.get(key)
+        if png is not None:
+            _VARIED_CACHE.move_to_end(key)
+            return png
+
+    png = _encode_png(apply_natural_variation(signature_pil, seed=seed))
+    with _VARIED_LOCK:
+        _VARIED_CACHE[key] = png
+        while len(_VARIED_CACHE) > _VARIED_CACHE_MAX:
+            _VARIED_CACHE.popitem(last=False)
+    return png
+
+
+def apply_natural_variation_bytes(signature_pil, seed=None):
+    """
+    apply_natural_variation, returned as PNG bytes ready for
+    ImageReader(io.BytesIO(...)) - no base64 round-trip for PDF embedding.
+    Seeded calls are cached per signature and seed.
+    """
+    if seed is None:
+        return _encode_png(apply_natural_variation(signature_pil))
+    return _varied_signature_png(signature_pil, _signature_fingerprint(signature_pil), seed)
+
+
+def _b64(png_bytes):
+    return base64.b64encode(png_bytes).decode('utf-8')
+
+
+def _document_seed(document_identifier):
+    """
+    32-bit seed for a document. Unlike hash(), which is salted per
+    interpreter (PYTHONHASHSEED), this is the same in every process.
+    """
+    digest = hashlib.blake2b(str(document_identifier).encode('utf-8'), digest_size=4).digest()
+    return int.from_bytes(digest, 'little')
 
 
 def get_varied_signature_base64(signature_pil, document_identifier):
@@ -74,20 +222,18 @@ def get_varied_signature_base64(signature_pil, document_identifier):
         document_identifier: Unique ID for this document (for consistent variation)
         
     Returns:
-        Base64 encoded PNG string
+        Base64 encoded PNG string (cached per signature and document)
     """
     # Use document identifier as seed for consistent variation per document
-    seed = hash(str(document_identifier)) % (2**32)
-    
-    # Apply variations
-    varied_sig = apply_natural_variation(signature_pil, seed=seed)
-    
-    # Convert to base64
-    buffer = io.BytesIO()
-    varied_sig.save(buffer, format='PNG')
-    buffer.seek(0)
-    
-    return base64.b64encode(buffer.getvalue()).decode('utf-8')
+    seed = _document_seed(document_identifier)
+    fp = _signature_fingerprint(signature_pil)
+    return _b64(_varied_signature_png(signature_pil, fp, seed))
+
+
+def clear_variation_cache():
+    """Drop every cached varied signature (e.g. after signatures change)."""
+    with _VARIED_LOCK:
+        _VARIED_CACHE.clear()
 
 
 def add_signature_variation_to_config():
@@ -95,14 +241,14 @@ def add_signature_variation_to_config():
     Add this function to config.py to enable signature variations.
     
     Usage in pdf_writer.py:
-        from app.core.signature_variation import apply_natural_variation
+        from app.core.signature_variation import apply_natural_variation_bytes
         
         # When drawing signature:
         sig_image = get_signature_for_location('pg13_certifying_official')
         if sig_image:
             # Apply variation based on document ID
-            varied_sig = apply_natural_variation(sig_image, seed=hash(member_name + ship))
-            _draw_signature_image(c, varied_sig, x, y, ...)
+            varied_png = apply_natural_variation_bytes(sig_image, seed=document_seed)
+            c.drawImage(ImageReader(io.BytesIO(varied_png)), x, y, ..., mask='auto')
     """
     pass
 
@@ -110,21 +256,24 @@ def add_signature_variation_to_config():
 # Example usage in pdf_writer.py:
 """
 # At top of file:
-from app.core.signature_variation import apply_natural_variation
+from reportlab.lib.utils import ImageReader
+from app.core.signature_variation import apply_natural_variation_bytes
 
 # When drawing signature:
 sig_image = get_signature_for_location('pg13_certifying_official')
 if sig_image is not None:
-    # Create unique variation for THIS document
-    document_id = f"{name}_{ship}_{start_date}"  # Unique per document
-    varied_sig = apply_natural_variation(sig_image, seed=hash(document_id))
+    # Create unique variation for THIS document (PNG bytes, no base64)
+    key = f"{name}_{ship}_{start_date}".encode()
+    document_seed = int.from_bytes(hashlib.blake2b(key, digest_size=4).digest(), 'little')
+    varied_png = apply_natural_variation_bytes(sig_image, seed=document_seed)
     
-    _draw_signature_image(
-        c,
-        varied_sig,  # Use varied signature instead of original
+    c.drawImage(
+        ImageReader(io.BytesIO(varied_png)),  # Varied signature instead of original
         sig_left_x - 10,
         sig_bottom_y,
-        max_width=170,
-        max_height=35
+        width=170,
+        height=35,
+        preserveAspectRatio=True,
+        mask='auto'
     )
 """
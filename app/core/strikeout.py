@@ -4,20 +4,29 @@
 # 3. Correcting the "Total Sea Pay Days" number when needed
 # 4. Handling multi-line event entries and manual overrides
 
+import hashlib
 import os
 import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import io
 import re
 
 import pytesseract
 from pdf2image import convert_from_path
-from PyPDF2 import PdfReader, PdfWriter
+from PIL import Image
+from pypdf import PdfReader, PdfWriter
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from pytesseract import Output
 
-from app.core.logger import log
+from app.core.logger import log, log_debug
 
 
 # ------------------------------------------------
@@ -29,12 +38,52 @@ FALLBACK_X_START = 260  # Default X start for total number position
 FALLBACK_X_END = 300  # Default X end for total number position
 STRIKE_LINE_X_START = 40  # Left edge of strikeout lines
 STRIKE_LINE_X_END = 550  # Right edge of strikeout lines
+OCR_FALLBACK_DPI = 150  # Raster resolution for sheets without a text layer
+
+# Token patterns, compiled once rather than looked up per token.
+# A date token is M/D/YY[YY] with anything but a further '/' after the year.
+_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4}[^/]*)$")
+_DIGITS_RE = re.compile(r"\d+")
+_ROW_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{2,4})")
+_NONDIGIT_RE = re.compile(r"\D")
+
+# Row text that continues the event on the dated row above it
+CONTINUATION_HINTS = [
+    "SBTT",
+    "MITE",
+    "ASW",
+    "ASTAC",
+    "T-",
+    "M-",
+    "*",
+    "(",
+    ")",
+]
+
+# Row text that is never valid sea pay and is always struck
+INVALID_MARKERS = [
+    "SBTT",
+    "MITE",
+    "ASTAC MITE",
+    "ASW MITE",
+    "ASW SBTT",  # Added for completeness
+]
+
+
+def _any_of(words):
+    """One pattern matching any of `words` as a plain substring."""
+    return re.compile("|".join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+
+
+_CONTINUATION_RE = _any_of(CONTINUATION_HINTS)
+_INVALID_RE = _any_of(INVALID_MARKERS)
 
 
 # ------------------------------------------------
 # DATE VARIANT BUILDER
 # ------------------------------------------------
 
+@lru_cache(maxsize=4096)
 def _build_date_variants(date_str):
     """
     Build a small set of date variants to match the same calendar day
@@ -44,13 +93,16 @@ def _build_date_variants(date_str):
       - '8/4/2025'
       - '8/4/25'
       - '08/04/25'
+
+    Memoized: the same dates recur across sheets, so the result is a
+    frozenset that callers cannot mutate.
     """
     variants = set()
     try:
         dt = datetime.strptime(date_str, "%m/%d/%Y")
     except Exception:
         # If parsing fails, just return the raw string
-        return {date_str}
+        return frozenset((date_str,))
 
     # Original as given
     variants.add(date_str)
@@ -64,7 +116,272 @@ def _build_date_variants(date_str):
     # Zero-padded month/day, 2-digit year
     variants.add(f"{dt.month:02d}/{dt.day:02d}/{dt.year % 100:02d}")
 
-    return variants
+    return frozenset(variants)
+
+
+def _date_key(month, day, year):
+    """(year, month, day) for the digit groups of M/D/YY[YY]: one key per calendar day."""
+    if len(year) == 2:
+        year = f"20{year}"
+    return (int(year), int(month), int(day))
+
+
+# ------------------------------------------------
+# OUTPUT DIRECTORIES
+# ------------------------------------------------
+# Created once per process instead of stat'ed for every marked sheet
+# (process_all already creates TORIS_CERT_FOLDER up front).
+_READY_DIRS = set()
+
+
+def _ensure_dir(path):
+    if path not in _READY_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _READY_DIRS.add(path)
+
+
+# ------------------------------------------------
+# POSITIONAL TOKENS
+# ------------------------------------------------
+# Each page comes back as ((width, height), [(text, left, top, w, h), ...])
+# with a top-left origin, in whatever units the source uses (PDF points for
+# the text layer, pixels for OCR). Callers scale to letter from the size.
+
+def _text_layer_pages(original_pdf):
+    """Word boxes from the PDF's own text layer (digitally generated sheets)."""
+    try:
+        import pdfplumber
+    except ImportError:
+        return []
+
+    pages = []
+    try:
+        with pdfplumber.open(original_pdf) as pdf:
+            for page in pdf.pages:
+                words = page.extract_words(keep_blank_chars=False, use_text_flow=False)
+                tokens = [
+                    (w["text"], w["x0"], w["top"], w["x1"] - w["x0"], w["bottom"] - w["top"])
+                    for w in words
+                    if w["text"].strip()
+                ]
+                pages.append(((float(page.width), float(page.height)), tokens))
+    except Exception as e:
+        log(f"⚠️ TEXT LAYER READ FAILED → {e}")
+        return []
+
+    if not any(tokens for _, tokens in pages):
+        return []
+    return pages
+
+
+def _ocr_image_list(paths, list_file):
+    """One tesseract run over every image in `paths`; tokens per image."""
+    with open(list_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(paths) + "\n")
+
+    data = pytesseract.image_to_data(list_file, output_type=Output.DICT)
+
+    tokens_by_page = [[] for _ in paths]
+    for j in range(len(data["text"])):
+        txt = data["text"][j].strip()
+        if not txt:
+            continue
+        tokens_by_page[int(data["page_num"][j]) - 1].append(
+            (txt, data["left"][j], data["top"][j], data["width"][j], data["height"][j])
+        )
+    return tokens_by_page
+
+
+def _ocr_images_in_process(paths):
+    """
+    Same tokens as _ocr_image_list, from tesserocr's in-process engine: the
+    model is loaded once per call and recognition releases the GIL, so
+    concurrent calls from a thread pool OCR pages in parallel.
+    """
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+
+    tokens_by_page = []
+    with PyTessBaseAPI() as api:
+        for path in paths:
+            api.SetImageFile(path)
+            api.Recognize()
+            tokens = []
+            for word in iterate_level(api.GetIterator(), RIL.WORD):
+                try:
+                    txt = (word.GetUTF8Text(RIL.WORD) or "").strip()
+                    box = word.BoundingBox(RIL.WORD)
+                except RuntimeError:
+                    continue
+                if not txt or not box:
+                    continue
+                x1, y1, x2, y2 = box
+                tokens.append((txt, x1, y1, x2 - x1, y2 - y1))
+            tokens_by_page.append(tokens)
+    return tokens_by_page
+
+
+def _ocr_run_count(n_pages):
+    """
+    How many tesseract runs to start side by side. Each run uses ~4 OpenMP
+    threads unless OMP_THREAD_LIMIT caps it (with OMP_THREAD_LIMIT=1 every
+    page gets its own run, up to one per core).
+    """
+    try:
+        threads_per_run = max(1, int(os.environ.get("OMP_THREAD_LIMIT") or 4))
+    except ValueError:
+        threads_per_run = 4
+    return max(1, min(n_pages, (os.cpu_count() or 1) // threads_per_run))
+
+
+def _ocr_pages(original_pdf):
+    """Rasterize + OCR every page (scanned sheets with no text layer)."""
+    # pdftoppm writes the pages straight to disk and tesseract reads them
+    # from list files, so no page is decoded into PIL and re-encoded.
+    with tempfile.TemporaryDirectory(prefix="toris_ocr_") as tmp:
+        # Grayscale at OCR_FALLBACK_DPI is plenty for printed text and a
+        # fraction of the default 200 DPI RGB; token coordinates are scaled
+        # from the image size, so the resolution does not matter downstream.
+        paths = convert_from_path(
+            original_pdf,
+            dpi=OCR_FALLBACK_DPI,
+            grayscale=True,
+            thread_count=max(1, (os.cpu_count() or 1) // 2),
+            output_folder=tmp,
+            paths_only=True,
+        )
+        if not paths:
+            return []
+
+        sizes = []
+        for path in paths:
+            with Image.open(path) as img:  # header only
+                sizes.append(img.size)
+
+        workers = _ocr_run_count(len(paths))
+        per_run = -(-len(paths) // workers)
+        chunks = [paths[i:i + per_run] for i in range(0, len(paths), per_run)]
+        list_files = [os.path.join(tmp, f"pages_{n}.txt") for n in range(len(chunks))]
+
+        # tesserocr (optional) keeps the engine in-process; otherwise one
+        # tesseract subprocess per chunk via pytesseract
+        try:
+            import tesserocr  # noqa: F401
+
+            run, run_args = _ocr_images_in_process, (chunks,)
+        except ImportError:
+            run, run_args = _ocr_image_list, (chunks, list_files)
+
+        if len(chunks) == 1:
+            results = list(map(run, *run_args))
+        else:
+            # Recognition runs outside the GIL either way, so threads suffice
+            with ThreadPoolExecutor(max_workers=len(chunks)) as ex:
+                results = list(ex.map(run, *run_args))
+
+    tokens_by_page = [tokens for chunk in results for tokens in chunk]
+    return list(zip(sizes, tokens_by_page))
+
+
+def _positional_pages(original_pdf):
+    pages = _text_layer_pages(original_pdf)
+    if pages:
+        log(f"  TOKENS FROM TEXT LAYER ({len(pages)} page(s))")
+        return pages
+    log("  NO TEXT LAYER → OCR")
+    return _ocr_pages(original_pdf)
+
+
+# ------------------------------------------------
+# RESULT CACHE
+# ------------------------------------------------
+# A marked sheet depends only on the original PDF and the marking inputs,
+# and review rebuilds re-run the same sheets with the same inputs. Marked
+# sheets carry member PII, so they are only kept in memory, bounded, and
+# dropped on reset (clear_strikeout_cache).
+_RESULT_CACHE_MAX = 32
+_RESULT_CACHE = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+# Positional tokens depend on the PDF bytes alone, so they survive changes
+# to skipped rows and overrides. They hold names, dates and ships in plain
+# text, so they get the same treatment as the marked sheets.
+_TOKEN_CACHE_MAX = 32
+_TOKEN_CACHE = OrderedDict()
+
+
+def _pdf_digest(original_pdf):
+    h = hashlib.blake2b(digest_size=16)
+    with open(original_pdf, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cached_positional_pages(original_pdf, pdf_digest):
+    """_positional_pages, memoized in memory by PDF content."""
+    cache_key = (pdf_digest, OCR_FALLBACK_DPI)
+    with _CACHE_LOCK:
+        pages = _TOKEN_CACHE.get(cache_key)
+        if pages is not None:
+            _TOKEN_CACHE.move_to_end(cache_key)
+    if pages is not None:
+        log("  TOKENS FROM CACHE")
+        return pages
+
+    pages = _positional_pages(original_pdf)
+    if pages:
+        with _CACHE_LOCK:
+            _TOKEN_CACHE[cache_key] = pages
+            while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+                _TOKEN_CACHE.popitem(last=False)
+    return pages
+
+
+def _result_cache_key(
+    pdf_digest,
+    skipped_duplicates,
+    skipped_unknown,
+    extracted_total_days,
+    computed_total_days,
+    strike_color,
+    override_valid_rows,
+    compress,
+):
+    return (
+        pdf_digest,
+        tuple(sorted(repr((u["date"], u["occ_idx"])) for u in skipped_unknown)),
+        tuple(sorted(repr((d["date"], d["occ_idx"])) for d in skipped_duplicates)),
+        str(extracted_total_days),
+        str(computed_total_days),
+        strike_color.lower(),
+        # None (normal run) and [] (rebuild, no overrides) mark differently
+        None if override_valid_rows is None
+        else tuple(sorted(str(r.get("date") or "") for r in override_valid_rows)),
+        bool(compress),
+    )
+
+
+def _cached_result(cache_key):
+    with _CACHE_LOCK:
+        data = _RESULT_CACHE.get(cache_key)
+        if data is not None:
+            _RESULT_CACHE.move_to_end(cache_key)
+        return data
+
+
+def _store_cached_result(cache_key, data):
+    with _CACHE_LOCK:
+        _RESULT_CACHE[cache_key] = data
+        _RESULT_CACHE.move_to_end(cache_key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def clear_strikeout_cache():
+    """Drop every cached marked sheet and token list (called on reset)."""
+    with _CACHE_LOCK:
+        _RESULT_CACHE.clear()
+        _TOKEN_CACHE.clear()
 
 
 # ------------------------------------------------
@@ -80,6 +397,7 @@ def mark_sheet_with_strikeouts(
     computed_total_days,
     strike_color="black",
     override_valid_rows=None,  # PATCH
+    compress=True,
 ):
     """
     Draws strikeout lines on the TORIS Sea Pay sheet for invalid/duplicate rows
@@ -94,6 +412,8 @@ def mark_sheet_with_strikeouts(
         computed_total_days: The total valid sea pay days we computed from logic.
         strike_color: 'black' or 'red' for strike lines.
         override_valid_rows: List of valid rows from overrides (to exclude from striking)
+        compress: Re-compress the content of pages that were marked. Unmarked
+            pages are always written as they are.
     """
 
     # ------------------------------------------------
@@ -108,10 +428,56 @@ def mark_sheet_with_strikeouts(
     try:
         log(f"MARKING SHEET START → {os.path.basename(original_pdf)}")
 
-        # Build sets of (date, occ_idx) to identify which rows are invalid/duplicate
-        targets_invalid = {(u["date"], u["occ_idx"]) for u in skipped_unknown}
-        targets_dup = {(d["date"], d["occ_idx"]) for d in skipped_duplicates}
-        all_targets = targets_invalid.union(targets_dup)
+        pdf_digest = _pdf_digest(original_pdf)
+        cache_key = _result_cache_key(
+            pdf_digest,
+            skipped_duplicates,
+            skipped_unknown,
+            extracted_total_days,
+            computed_total_days,
+            strike_color,
+            override_valid_rows,
+            compress,
+        )
+        cached = _cached_result(cache_key)
+        if cached is not None:
+            _ensure_dir(os.path.dirname(output_path))
+            with open(output_path, "wb") as f:
+                f.write(cached)
+            log(f"MARKED SHEET FROM CACHE → {os.path.basename(output_path)}")
+            return
+
+        # Parsed once: used for the total-days text fallback and the overlays
+        reader = PdfReader(original_pdf)
+
+        # ------------------------------------------------
+        # FAST PATH: NOTHING TO MARK
+        # ------------------------------------------------
+        # No rows to strike, no overrides and the total already right: the
+        # output is the original sheet, unless it carries SBTT/MITE text the
+        # auto-strike pass would catch. That is checked on the text layer, so
+        # scanned sheets (no text) always take the full path.
+        if (
+            not skipped_unknown
+            and not skipped_duplicates
+            and not override_valid_rows
+            and _NONDIGIT_RE.sub("", str(extracted_total_days or "")) == str(computed_total_days)
+        ):
+            sheet_text = "\n".join(pg.extract_text() or "" for pg in reader.pages).upper()
+            if sheet_text.strip() and not _INVALID_RE.search(sheet_text):
+                _ensure_dir(os.path.dirname(output_path))
+                shutil.copy2(original_pdf, output_path)
+                log(f"NOTHING TO MARK → COPIED {os.path.basename(original_pdf)}")
+                return
+
+        # (date, occ_idx) -> "invalid" | "dup" for the rows to strike; a row
+        # listed as both is struck as invalid (registered first anyway)
+        target_kind = {}
+        date_occ = itemgetter("date", "occ_idx")
+        for u in skipped_unknown:
+            target_kind[date_occ(u)] = "invalid"
+        for d in skipped_duplicates:
+            target_kind.setdefault(date_occ(d), "dup")
         
         # 🔹 FIX: Build set of dates that have valid overrides
         # These should NEVER be struck out, even if they're in skipped_unknown
@@ -120,21 +486,21 @@ def mark_sheet_with_strikeouts(
             for r in override_valid_rows:
                 date_str = r.get("date")
                 if date_str:
-                    # 🔹 CRITICAL FIX: Normalize date to MM/DD/YYYY format
+                    # 🔹 CRITICAL FIX: Normalize date to MM/DD/YYYY format (the
+                    # form row dates are keyed by) plus every variant of it
                     # This ensures "8/28/2025" and "08/28/2025" both match
+                    override_valid_dates.add(date_str)
                     try:
                         dt = datetime.strptime(date_str, "%m/%d/%Y")
-                        normalized_date = f"{dt.month:02d}/{dt.day:02d}/{dt.year}"
-                        override_valid_dates.add(normalized_date)
-                        # Also add the original format to handle all variations
-                        override_valid_dates.add(date_str)
+                        date_str = f"{dt.month:02d}/{dt.day:02d}/{dt.year}"
                     except Exception:
-                        # If parsing fails, add as-is
-                        override_valid_dates.add(date_str)
+                        # If parsing fails, keep it as-is
+                        pass
+                    override_valid_dates |= _build_date_variants(date_str)
             log(f"OVERRIDE VALID DATES (NO STRIKE) → {', '.join(sorted(override_valid_dates))}")
         
-        # Convert all pages to images for positional OCR
-        pages = convert_from_path(original_pdf)
+        # Word positions from the text layer, or OCR when there is none
+        pages = _cached_positional_pages(original_pdf, pdf_digest)
         row_list = []
 
         # ------------------------------------------------
@@ -142,91 +508,60 @@ def mark_sheet_with_strikeouts(
         # ------------------------------------------------
         # FIX: Scan for ALL dates on the sheet, not just invalid ones
         # This allows auto-strike to catch SBTT/MITE that parser missed
-        all_dates_from_targets = {d for (d, _) in all_targets}
-        
-        if override_valid_rows:
-            for r in override_valid_rows:
-                if r.get("date"):
-                    all_dates_from_targets.add(r["date"])
 
-        # ocr_tokens[page_index] = list of (text, left, top, w, h)
-        ocr_tokens = {}
+        # digit_tokens[page_index] = list of (y, left, w) for digit-only
+        # tokens, the candidates for the "Total Sea Pay Days" number
+        digit_tokens = {}
         all_dates = set()  # Will collect ALL dates found on sheet
 
-        for page_index, img in enumerate(pages):
-            log(f"  BUILDING ROWS FROM PAGE {page_index + 1}/{len(pages)}")
+        for page_index, ((_, img_h), page_token_list) in enumerate(pages):
+            log_debug(lambda: f"  BUILDING ROWS FROM PAGE {page_index + 1}/{len(pages)}")
 
-            data = pytesseract.image_to_data(img, output_type=Output.DICT)
-            img_h = img.size[1]
             scale_y = letter[1] / float(img_h)
 
             tokens = []
-            page_token_list = []
-
-            for j in range(len(data["text"])):
-                txt = data["text"][j].strip()
-                if not txt:
-                    continue
-
-                left = data["left"][j]
-                top = data["top"][j]
-                width = data["width"][j]
-                height = data["height"][j]
-
-                page_token_list.append((txt, left, top, width, height))
+            page_digits = digit_tokens[page_index] = []
 
+            for (txt, left, top, width, height) in page_token_list:
                 center_y_img = top + height / 2.0
                 center_from_bottom_px = img_h - center_y_img
                 y = center_from_bottom_px * scale_y
 
-                tokens.append({"text": txt.upper(), "y": y})
+                tokens.append((y, txt.upper()))
+
+                if _DIGITS_RE.fullmatch(txt):
+                    page_digits.append((y, left, width))
                 
                 # FIX: Extract ALL dates from OCR for auto-strike scanning
-                if re.match(r'\d{1,2}/\d{1,2}/\d{2,4}', txt):
-                    # Try to normalize to MM/DD/YYYY format
-                    try:
-                        parts = txt.split('/')
-                        if len(parts) == 3:
-                            month, day, year = parts
-                            if len(year) == 2:
-                                year = f"20{year}"
-                            normalized_date = f"{int(month):02d}/{int(day):02d}/{year}"
-                            all_dates.add(normalized_date)
-                    except Exception:
-                        all_dates.add(txt)
-
-            ocr_tokens[page_index] = page_token_list
-
-            # Sort descending by Y (from top of PDF downwards)
-            tokens.sort(key=lambda t: -t["y"])
-
-            # Cluster tokens into visual rows
+                m = _DATE_RE.match(txt)
+                if m:
+                    # Normalize to MM/DD/YYYY format
+                    month, day, year = m.groups()
+                    if len(year) == 2:
+                        year = f"20{year}"
+                    all_dates.add(f"{int(month):02d}/{int(day):02d}/{year}")
+
+            # Sort descending by Y (from top of PDF downwards; stable on ties)
+            tokens.sort(key=itemgetter(0), reverse=True)
+
+            # Cluster tokens into visual rows: a new row starts wherever the
+            # gap to the previous token exceeds the threshold
             visual_rows = []
-            current_row = []
             last_y = None
 
-            for tok in tokens:
-                if last_y is None:
-                    current_row = [tok]
-                    last_y = tok["y"]
-                    continue
-
-                if abs(tok["y"] - last_y) <= VERTICAL_GROUPING_THRESHOLD:
-                    current_row.append(tok)
-                    last_y = tok["y"]
-                else:
-                    visual_rows.append(current_row)
-                    current_row = [tok]
-                    last_y = tok["y"]
-
-            if current_row:
-                visual_rows.append(current_row)
+            for y, text in tokens:
+                if last_y is None or last_y - y > VERTICAL_GROUPING_THRESHOLD:
+                    row_ys, row_texts = [], []
+                    visual_rows.append((row_ys, row_texts))
+                row_ys.append(y)
+                row_texts.append(text)
+                last_y = y
 
             # Build row objects with average Y and concatenated text
             tmp_rows = []
-            for row in visual_rows:
-                y_avg = sum(t["y"] for t in row) / len(row)
-                text = " ".join(t["text"] for t in row)
+            for row_ys, row_texts in visual_rows:
+                y_avg = sum(row_ys) / len(row_ys)
+                text = " ".join(row_texts)
                 tmp_rows.append({
                     "page": page_index,
                     "y": y_avg,
@@ -240,15 +575,21 @@ def mark_sheet_with_strikeouts(
 
             row_list.extend(tmp_rows)
 
-        # Build date variants for ALL dates found
-        date_variants_map = {d: _build_date_variants(d) for d in all_dates}
+        # Key ALL dates found by calendar day, so "8/4/25" and "08/04/2025"
+        # in a row both find the same date without expanding variants
+        date_key_map = {}
+        for d in sorted(all_dates):
+            m = _ROW_DATE_RE.match(d)
+            if m:
+                date_key_map.setdefault(_date_key(*m.groups()), d)
 
-        # Assign date + occurrence index to ALL rows
+        # Assign date + occurrence index to ALL rows: the leftmost date token
+        # in the row text that is one of the sheet's dates
         date_counters = {d: 0 for d in all_dates}
         for row in row_list:
-            for d in all_dates:
-                variants = date_variants_map[d]
-                if any(v in row["text"] for v in variants):
+            for m in _ROW_DATE_RE.finditer(row["text"]):
+                d = date_key_map.get(_date_key(*m.groups()))
+                if d:
                     date_counters[d] += 1
                     row["date"] = d
                     row["occ_idx"] = date_counters[d]
@@ -257,18 +598,6 @@ def mark_sheet_with_strikeouts(
         # ------------------------------------------------
         # PATCH: MERGE MULTI-LINE EVENTS INTO DATE ROWS (SEQUENTIAL)
         # ------------------------------------------------
-        CONTINUATION_HINTS = [
-            "SBTT",
-            "MITE",
-            "ASW",
-            "ASTAC",
-            "T-",
-            "M-",
-            "*",
-            "(",
-            ")",
-        ]
-
         rows_by_page = {}
         for r in row_list:
             rows_by_page.setdefault(r["page"], []).append(r)
@@ -286,48 +615,46 @@ def mark_sheet_with_strikeouts(
                     continue
 
                 txt = (r.get("text") or "").upper()
-                if any(h in txt for h in CONTINUATION_HINTS):
+                if _CONTINUATION_RE.search(txt):
                     current_date_row["text"] = (
                         current_date_row["text"] + " " + txt
                     ).strip()
                     r["_absorbed"] = True
-                    log(
+                    log_debug(lambda: (
                         f"MERGED MULTILINE EVENT → PAGE {page_idx + 1} "
                         f"DATE {current_date_row['date']} TEXT '{txt[:40]}'"
-                    )
+                    ))
 
         row_list = [r for r in row_list if not r.get("_absorbed")]
 
-        # ------------------------------------------------
-        # PATCH: APPLY MANUAL OVERRIDES TO ROWS (ROW-LEVEL)
-        # ------------------------------------------------
-        if override_valid_rows:
-            override_dates = {r["date"] for r in override_valid_rows if r.get("date")}
-        
-            for row in row_list:
-                if row.get("date") and row["date"] in override_dates:
-                    row["override"] = True
-                    log(
-                        f"APPLIED OVERRIDE FLAG → DATE={row['date']} "
-                        f"TEXT='{row['text'][:40]}'"
-                    )
-
         # ------------------------------------------------
         # HELPER: FIND NEAREST DATE ROW ON A PAGE
         # ------------------------------------------------
+        # Dated rows per page, top to bottom, indexed once by negated Y so
+        # each lookup is a bisect instead of a scan of every row.
+        date_rows_by_page = {}
+        for r in row_list:
+            if r.get("date"):
+                date_rows_by_page.setdefault(r["page"], []).append(r)
+        for rows in date_rows_by_page.values():
+            rows.sort(key=lambda r: -r["y"])
+        neg_y_by_page = {p: [-r["y"] for r in rows] for p, rows in date_rows_by_page.items()}
+
         def _find_nearest_date_row(page_idx, y_target):
             """Return the row on this page that has a date and is closest in Y."""
-            best = None
-            best_delta = None
-            for r in row_list:
-                if r["page"] != page_idx:
-                    continue
-                if not r.get("date"):
-                    continue
-                delta = abs(r["y"] - y_target)
-                if best is None or delta < best_delta:
-                    best = r
-                    best_delta = delta
+            rows = date_rows_by_page.get(page_idx)
+            if not rows:
+                return None
+            keys = neg_y_by_page[page_idx]
+
+            # First row at or below y_target, and the first row of the run
+            # just above it; on equal distance the upper (earlier) row wins
+            i = bisect_left(keys, -y_target)
+            best = rows[i] if i < len(rows) else None
+            if i > 0:
+                above = rows[bisect_left(keys, keys[i - 1])]
+                if best is None or abs(above["y"] - y_target) <= abs(best["y"] - y_target):
+                    best = above
             return best
 
         # ------------------------------------------------
@@ -346,87 +673,54 @@ def mark_sheet_with_strikeouts(
 
         # ------------------------------------------------
         # 1) Strike rows from skipped_unknown / skipped_duplicates
-        # 🔹 MULTI-LAYER FIX: Check override_valid_dates AND row override field
+        # 🔹 FIX: Rows whose date is in override_valid_dates are never struck
+        # One pass over the rows; invalid strikes are still registered before
+        # duplicate ones, so the first (page, date) registration wins as before.
         # ------------------------------------------------
+        invalid_rows = []
+        dup_rows = []
         for row in row_list:
             date = row.get("date")
             occ_idx = row.get("occ_idx")
             if not date or not occ_idx:
                 continue
 
-            # 🔹 LAYER 1: Check override_valid_dates set
-            if date in override_valid_dates:
-                log(
-                    f"    ✅ SKIP STRIKE (IN OVERRIDE SET) → {date} OCC#{occ_idx} "
-                    f"PAGE {row['page'] + 1}"
-                )
-                continue
-            
-            # 🔹 LAYER 2: Check if row has override flag (set earlier in this function)
-            if row.get("override") is True:
-                log(
-                    f"    ✅ SKIP STRIKE (ROW HAS OVERRIDE FLAG) → {date} OCC#{occ_idx} "
-                    f"PAGE {row['page'] + 1}"
-                )
-                continue
-
-            if (date, occ_idx) in targets_invalid:
-                _register_strike(row["page"], date, row["y"])
-                log(
-                    f"    STRIKEOUT INVALID DATE {date} OCC#{occ_idx} "
-                    f"PAGE {row['page'] + 1} Y={row['y']:.1f}"
-                )
-
-        for row in row_list:
-            date = row.get("date")
-            occ_idx = row.get("occ_idx")
-            if not date or not occ_idx:
-                continue
-
-            # 🔹 LAYER 1: Check override_valid_dates set
             if date in override_valid_dates:
-                log(
+                log_debug(lambda: (
                     f"    ✅ SKIP STRIKE (IN OVERRIDE SET) → {date} OCC#{occ_idx} "
                     f"PAGE {row['page'] + 1}"
-                )
-                continue
-            
-            # 🔹 LAYER 2: Check if row has override flag
-            if row.get("override") is True:
-                log(
-                    f"    ✅ SKIP STRIKE (ROW HAS OVERRIDE FLAG) → {date} OCC#{occ_idx} "
-                    f"PAGE {row['page'] + 1}"
-                )
+                ))
                 continue
 
-            if (date, occ_idx) in targets_dup:
-                _register_strike(row["page"], date, row["y"])
-                log(
-                    f"    STRIKEOUT DUP DATE {date} OCC#{occ_idx} "
-                    f"PAGE {row['page'] + 1} Y={row['y']:.1f}"
-                )
+            kind = target_kind.get((date, occ_idx))
+            if kind == "invalid":
+                invalid_rows.append(row)
+            elif kind == "dup":
+                dup_rows.append(row)
+
+        for row in invalid_rows:
+            _register_strike(row["page"], row["date"], row["y"])
+            log(
+                f"    STRIKEOUT INVALID DATE {row['date']} OCC#{row['occ_idx']} "
+                f"PAGE {row['page'] + 1} Y={row['y']:.1f}"
+            )
+
+        for row in dup_rows:
+            _register_strike(row["page"], row["date"], row["y"])
+            log(
+                f"    STRIKEOUT DUP DATE {row['date']} OCC#{row['occ_idx']} "
+                f"PAGE {row['page'] + 1} Y={row['y']:.1f}"
+            )
         
         # ------------------------------------------------
         # AUTO-STRIKE INVALID TEXT MARKERS
         # FIX: Now scans ALL rows, not just pre-flagged invalid ones
         # 🔹 FIX: Also respects override_valid_dates
         # ------------------------------------------------
-        INVALID_MARKERS = [
-            "SBTT",
-            "MITE",
-            "ASTAC MITE",
-            "ASW MITE",
-            "ASW SBTT",  # Added for completeness
-        ]
-        
         for row in row_list:
-            if row.get("override") is True:
-                log(f"SKIP AUTO-STRIKE (ROW HAS MANUAL OVERRIDE) → DATE={row.get('date')}")
-                continue
-        
             text = row["text"]
         
-            if any(marker in text for marker in INVALID_MARKERS):
+            if _INVALID_RE.search(text):
                 if row.get("date"):
                     target_date = row["date"]
                     target_y = row["y"]
@@ -441,10 +735,10 @@ def mark_sheet_with_strikeouts(
         
                 # 🔹 FIX: Check if target date has valid override
                 if target_date in override_valid_dates:
-                    log(
+                    log_debug(lambda: (
                         f"SKIP AUTO-STRIKE (VALID OVERRIDE) → '{text[:40]}' "
                         f"DATE={target_date} PAGE {row['page'] + 1}"
-                    )
+                    ))
                     continue
         
                 _register_strike(row["page"], target_date, target_y)
@@ -468,31 +762,25 @@ def mark_sheet_with_strikeouts(
                 total_row = row
                 break
         
-        total_overlay = None
+        # (start_x, y, end_x, text) of the total correction, drawn with the
+        # strike lines below
+        total_mark = None
         
         if total_row:
             page_idx = total_row["page"]
             target_y_pdf = total_row["y"]
         
-            page_img = pages[page_idx]
-            width_img, height_img = page_img.size
+            width_img = pages[page_idx][0][0]
             scale_x = letter[0] / float(width_img)
         
-            tokens_page = ocr_tokens[page_idx]
-        
             old_start_x_pdf = None
             old_end_x_pdf = None
         
-            for (txt, left, top, w, h) in tokens_page:
-                if re.fullmatch(r"\d+", txt):
-                    center_y_img = top + h / 2.0
-                    center_from_bottom_px = height_img - center_y_img
-                    y_pdf = center_from_bottom_px * (letter[1] / float(height_img))
-        
-                    if abs(y_pdf - target_y_pdf) < Y_COORDINATE_TOLERANCE:
-                        old_start_x_pdf = left * scale_x
-                        old_end_x_pdf = (left + w) * scale_x
-                        break
+            for (y_pdf, left, w) in digit_tokens[page_idx]:
+                if abs(y_pdf - target_y_pdf) < Y_COORDINATE_TOLERANCE:
+                    old_start_x_pdf = left * scale_x
+                    old_end_x_pdf = (left + w) * scale_x
+                    break
         
             if old_start_x_pdf is None:
                 old_start_x_pdf = FALLBACK_X_START
@@ -511,14 +799,13 @@ def mark_sheet_with_strikeouts(
             # ------------------------------------------------
 
             # Extract digits from OCR (may be blank)
-            clean_extracted = re.sub(r"\D", "", str(extracted_total_days or "")).strip()
+            clean_extracted = _NONDIGIT_RE.sub("", str(extracted_total_days or "")).strip()
             computed_str = str(computed_total_days)
 
             # If OCR missed it, try a text fallback from the ORIGINAL PDF (not output_path)
             if not clean_extracted:
                 try:
-                    pdf_reader = PdfReader(original_pdf)
-                    page_text = pdf_reader.pages[page_idx].extract_text() or ""
+                    page_text = reader.pages[page_idx].extract_text() or ""
                     m = re.search(
                         r"Total\s+Sea\s+Pay\s+Days.*?(\d+)",
                         page_text,
@@ -541,86 +828,93 @@ def mark_sheet_with_strikeouts(
             if in_rebuild and not overrides_exist:
                 # rebuild called but no overrides provided → don't touch totals
                 log("TOTAL DAYS SKIP → rebuild mode (no overrides)")
-                total_overlay = None
             elif totals_match:
                 # Totals match, no correction needed
                 log(
                     f"TOTAL DAYS MATCH → extracted={clean_extracted} "
                     f"computed={computed_str} (NO STRIKE)"
                 )
-                total_overlay = None
             else:
                 # Totals don't match or OCR missed it → create correction overlay
                 log(
                     f"TOTAL DAYS MISMATCH/UNKNOWN → extracted={clean_extracted or 'None'} "
                     f"computed={computed_str} (STRIKE + CORRECT)"
                 )
-                
-                buf = io.BytesIO()
-                c = canvas.Canvas(buf, pagesize=letter)
-                c.setFont("Helvetica", 10)
-        
-                three_spaces_width = c.stringWidth("   ", "Helvetica", 10)
-                correct_x_pdf = old_end_x_pdf + three_spaces_width
-                strike_end_x = correct_x_pdf - three_spaces_width
-        
-                c.setLineWidth(0.8)
-                c.setStrokeColorRGB(*rgb)
-                
-                c.line(old_start_x_pdf, target_y_pdf, strike_end_x, target_y_pdf)
-                c.drawString(correct_x_pdf, target_y_pdf, computed_str)
-                
-                c.save()
-                buf.seek(0)
-                total_overlay = PdfReader(buf)
+                total_mark = (old_start_x_pdf, target_y_pdf, old_end_x_pdf, computed_str)
 
         # ------------------------------------------------
-        # NORMAL STRIKEOUT LINES
+        # OVERLAY: TOTAL CORRECTION + NORMAL STRIKEOUT LINES
         # ------------------------------------------------
-        overlays = []
-        for p in range(len(pages)):
-            date_to_y = strike_targets_by_page.get(p)
-            if not date_to_y:
-                overlays.append(None)
-                continue
-
+        # One overlay document, one page per sheet page up to the last one
+        # marked, parsed once. Unmarked pages are left blank and not merged.
+        marked_pages = {p for p, date_to_y in strike_targets_by_page.items() if date_to_y}
+        if total_mark:
+            marked_pages.add(total_row["page"])
+
+        overlay = None
+        if marked_pages:
             buf = io.BytesIO()
             c = canvas.Canvas(buf, pagesize=letter)
-            c.setLineWidth(0.8)
-            c.setStrokeColorRGB(*rgb)
 
-            for date_str, y in date_to_y.items():
-                c.line(STRIKE_LINE_X_START, y, STRIKE_LINE_X_END, y)
+            for p in range(max(marked_pages) + 1):
+                if total_mark and p == total_row["page"]:
+                    start_x, y, end_x, text = total_mark
+                    c.setFont("Helvetica", 10)
+
+                    three_spaces_width = c.stringWidth("   ", "Helvetica", 10)
+                    correct_x_pdf = end_x + three_spaces_width
+                    strike_end_x = correct_x_pdf - three_spaces_width
+
+                    c.setLineWidth(0.8)
+                    c.setStrokeColorRGB(*rgb)
+
+                    c.line(start_x, y, strike_end_x, y)
+                    c.drawString(correct_x_pdf, y, text)
+
+                date_to_y = strike_targets_by_page.get(p)
+                if date_to_y:
+                    c.setLineWidth(0.8)
+                    c.setStrokeColorRGB(*rgb)
+
+                    for date_str, y in date_to_y.items():
+                        c.line(STRIKE_LINE_X_START, y, STRIKE_LINE_X_END, y)
+
+                c.showPage()
 
             c.save()
             buf.seek(0)
-            overlays.append(PdfReader(buf))
+            overlay = PdfReader(buf)
 
         # ------------------------------------------------
         # APPLY OVERLAYS
         # ------------------------------------------------
-        reader = PdfReader(original_pdf)
         writer = PdfWriter()
 
         for i, page in enumerate(reader.pages):
-            if total_overlay and total_row and i == total_row["page"]:
-                page.merge_page(total_overlay.pages[0])
-
-            if i < len(overlays) and overlays[i] is not None:
-                page.merge_page(overlays[i].pages[0])
+            # Merge into the writer's copy: pypdf only compresses pages that
+            # belong to a writer
+            page = writer.add_page(page)
 
-            try:
-                page.compress_content_streams()
-            except Exception:
-                pass
+            if overlay and i in marked_pages:
+                page.merge_page(overlay.pages[i])
 
-            writer.add_page(page)
+                # Only merged pages have new (uncompressed) content; re-parsing
+                # and deflating untouched pages gains nothing
+                if compress:
+                    try:
+                        page.compress_content_streams()
+                    except Exception:
+                        pass
 
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        buf = io.BytesIO()
+        writer.write(buf)
+        data = buf.getvalue()
+        _ensure_dir(os.path.dirname(output_path))
         with open(output_path, "wb") as f:
-            writer.write(f)
+            f.write(data)
 
         log(f"MARKED SHEET CREATED → {os.path.basename(output_path)}")
+        _store_cached_result(cache_key, data)
 
     except Exception as e:
         log(f"⚠️ MARKING FAILED → {e}")
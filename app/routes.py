@@ -41,6 +41,7 @@ from app.core.overrides import (
 
 from app.processing import rebuild_outputs_from_review, rebuild_single_member
 from app.core.merge import merge_all_pdfs
+from app.core.strikeout import clear_strikeout_cache
 
 bp = Blueprint("routes", __name__)
 FRONTEND_DIR = os.path.join(os.path.dirname(__file__), "web", "frontend")
@@ -145,7 +146,7 @@ def process_route():
     if "rates_csv" in request.files:
         request.files["rates_csv"].save(RATE_FILE)
         try:
-            rates.load_rates()
+            rates.reload_rates()
         except Exception as e:
             log(f"RATES CSV RELOAD ERROR → {e}")
         else:
@@ -793,6 +794,7 @@ def reset():
         except Exception as e:
             log(f"RESET ORIGINAL BACKUP ERROR → {e}")
 
+    clear_strikeout_cache()
     clear_logs()
     reset_progress()
     log("RESET COMPLETE (files cleared)")